@@ -180,7 +180,7 @@ class UQResult:
     def __getattribute__(self, attr):
         try:
             # Calling the super class to avoid recursion
-            if (attr!='type' and not '__' in attr) and super(UQResult, self).__getattribute__('type') == 'void':
+            if (attr not in ['type','rescale'] and not '__' in attr) and super(UQResult, self).__getattribute__('type') == 'void':
                 # Check if the uncertainty quantification has been done, if not report that there is nothing in the object
                 raise ValueError(f"The requested attribute/method ('{attr}') is not available. Uncertainty quantification has not been calculated during the fit.")
         except AttributeError:
@@ -364,7 +364,7 @@ class UQResult:
             values,pdf = self.pardist(n)
             # Compute corresponding CDF
             cdf = np.cumsum(pdf)
-            cdf /= max(cdf)
+            cdf /= np.max(cdf)
             # Eliminate duplicates
             cdf, index = np.lib.arraysetops.unique(cdf,return_index=True)
             # Interpolate requested percentile
@@ -456,7 +456,7 @@ class UQResult:
 
     # Error Propagation (covariance-based only)
     #--------------------------------------------------------------------------------
-    def propagate(self,model,lb=None,ub=None,samples=None):
+    def propagate(self,model,lb=None,ub=None,samples=None,jacobian=None):
         """
         Uncertainty propagation. This function takes the uncertainty analysis of the 
         parameters and propagates it to another function depending on those parameters.
@@ -469,6 +469,10 @@ class UQResult:
             Lower bounds of the values returned by ``model``, by default assumed unconstrained.
         ubm : ndarray
             Upper bounds of the values returned by ``model``, by default assumed unconstrained.
+        jacobian : callable, optional
+            Function taking an array of ``nparam`` parameters and returning the Jacobian matrix
+            of ``model`` with respect to the parameters. Only used for covariance-based uncertainty 
+            propagation. If not specified, the Jacobian is estimated via finite differences.
 
         Returns
         -------
@@ -499,12 +503,17 @@ class UQResult:
 
         if self.type=='covariance':
 
+            modelfit_ = modelfit
             if iscomplex:
                 model_ = model 
                 model = lambda p: np.concatenate([model_(p).real,model_(p).imag])
+                modelfit_ = np.concatenate([modelfit.real,modelfit.imag])
 
             # Get jacobian of model to be propagated with respect to parameters
-            J = Jacobian(model,parfit,self.__lb,self.__ub)
+            if jacobian is None:
+                J = Jacobian(model,parfit,self.__lb,self.__ub,f0=modelfit_)
+            else:
+                J = np.atleast_2d(jacobian(parfit))
 
             # Clip at boundaries
             modelfit = np.maximum(modelfit,lb)
@@ -524,20 +533,16 @@ class UQResult:
 
         elif self.type=='bootstrap':
 
-            sampled_parameters = [[] for _ in range(self.nparam)]
+            sampled_parameters = np.zeros((self.nparam,Nsamples))
             for n in range(self.nparam):
                 # Get the parameter uncertainty distribution
                 values,pdf = self.pardist(n)
-                # Random sampling form the uncertainty distribution
+                # Random sampling form the uncertainty distribution (all samples drawn at once)
                 np.random.seed(0)
-                sampled_parameters[n] =  [np.random.choice(values, p=pdf/sum(pdf)) for _ in range(Nsamples)]
-            # Convert to matrix
-            sampled_parameters = np.atleast_2d(sampled_parameters)
+                sampled_parameters[n,:] = np.random.choice(values, size=Nsamples, p=pdf/np.sum(pdf))
 
-            # Bootstrap sampling of the model response
-            sampled_model = [model(sampled_parameters[:,n]) for n in range(Nsamples)]
-            sampled_model = [np.maximum(sample,lb) for sample in sampled_model]
-            sampled_model = [np.minimum(sample,ub) for sample in sampled_model]
+            # Bootstrap sampling of the model response, clipped at the boundaries
+            sampled_model = [np.clip(model(sampled_parameters[:,n]),lb,ub) for n in range(Nsamples)]
 
             # Convert to matrix
             sampled_model = np.atleast_2d(sampled_model)
@@ -547,4 +552,59 @@ class UQResult:
  
     #--------------------------------------------------------------------------------
 
+
+    # Rescaling of the uncertainty
+    #--------------------------------------------------------------------------------
+    def rescale(self,factor,lb=None,ub=None):
+        """
+        Rescale the uncertainty quantification of the parameters by a scalar factor. Equivalent 
+        to propagating the uncertainty through the function ``lambda p: factor*p``, but computed directly. 
+
+        Parameters
+        ----------
+        factor : float scalar
+            Scaling factor of the parameters. Must be positive for profile-based uncertainties.
+        lb : ndarray, optional
+            Lower bounds of the rescaled parameters, by default the rescaled original lower bounds.
+        ub : ndarray, optional
+            Upper bounds of the rescaled parameters, by default the rescaled original upper bounds.
+
+        Returns
+        -------
+        uq : :ref:`UQResult`
+            New uncertainty quantification analysis for the rescaled parameters.
+        """
+        # Nothing to rescale if the uncertainty has not been quantified
+        if self.type=='void':
+            return UQResult('void')
+
+        if lb is None or ub is None:
+            lb_,ub_ = (factor*np.asarray(bound) for bound in [self.__lb,self.__ub])
+            if factor<0: 
+                lb_,ub_ = ub_,lb_
+            lb = lb_ if lb is None else lb
+            ub = ub_ if ub is None else ub
+        lb,ub = (np.broadcast_to(np.atleast_1d(var),(self.nparam,)) for var in [lb,ub])
+
+        if self.type=='covariance':
+            mean = np.minimum(np.maximum(factor*self.mean,lb),ub)
+            return UQResult('covariance',mean,factor**2*self.covmat,lb,ub)
+
+        elif self.type=='bootstrap':
+            samples = np.minimum(np.maximum(factor*self.samples,lb),ub)
+            return UQResult('bootstrap',data=samples,lb=lb,ub=ub)
+
+        elif self.type=='profile':
+            if factor<=0:
+                raise ValueError('Profile-based uncertainties can only be rescaled by positive factors.')
+            # Rescale the parameter axes of the profiles, the objective function values are unaffected
+            profiles = self.profile if isinstance(self.profile,list) else [self.profile]
+            profiles = [{'x':factor*np.asarray(profile['x']), 'y':profile['y']} for profile in profiles]
+            parfit = factor*np.asarray(self.__parfit)
+            uq = UQResult('profile',data=parfit,profiles=profiles,threshold=self.threshold,noiselvl=self.__noiselvl,lb=lb,ub=ub)
+            if not isinstance(self.profile,list):
+                uq.profile = uq.profile[0]
+            return uq
+    #--------------------------------------------------------------------------------
+
 # =========================================================================
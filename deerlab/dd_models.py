@@ -110,7 +110,7 @@ def _multigaussfun(r,r0,sig):
     P = np.sqrt(1/(2*np.pi))*1/sig*np.exp(-0.5*((r.T-r0)/sig)**2)
     if not np.all(P==0):
         # Normalization
-        P = np.squeeze(P)/np.sum([np.trapz(c,r) for c in P.T])
+        P = np.squeeze(P)/np.sum(np.trapz(P,r.T,axis=0))
     else: 
         P = np.squeeze(P)
     return P
@@ -129,7 +129,7 @@ def _multirice3dfun(r,nu,sig):
     P[P<0] = 0
     
     # Normalization
-    P = np.squeeze(P)/np.sum([np.trapz(c,np.squeeze(r)) for c in P.T])
+    P = np.squeeze(P)/np.sum(np.trapz(P,r,axis=0))
     return P
 # =================================================================
 
@@ -1027,7 +1027,7 @@ def _wormgauss(r,contour,persistence,std):
     P = np.convolve(gauss,P,mode='full')
     # Adjust new convoluted axis
     idxconv = np.argmax(P)
-    rconv = np.linspace(min(r),max(r)*2,len(P))
+    rconv = np.linspace(np.min(r),np.max(r)*2,len(P))
     rconv = rconv - abs(r[idx] - rconv[idxconv])
     #Interpolate down to original axis
     P = np.interp(r,rconv,P)
@@ -250,7 +250,31 @@ def dipolarkernel(t, r, *, pathways=None, mod=None, bg=None, method='fresnel', e
     return K
 #==============================================================================
 
-@cached(max_size=5)
+def _hashable(arg):
+#==============================================================================
+    "Converts array arguments into exact, hashable cache keys"
+    # The default key of the memoization package relies on str(), which truncates 
+    # large arrays and rounds their elements, leading to cache collisions
+    if isinstance(arg,np.ndarray):
+        return (arg.dtype.str, arg.shape, arg.tobytes())
+    if isinstance(arg,(list,tuple)):
+        return tuple(_hashable(element) for element in arg)
+    try:
+        hash(arg)
+    except TypeError:
+        return str(arg)
+    return arg
+#==============================================================================
+
+def _Cgrid_key(ωr,t,ωex,q,complex):
+    "Cache key for the powder kernel matrix"
+    return tuple(_hashable(arg) for arg in (ωr,t,ωex,q,complex))
+
+def _elementarykernel_key(t,r,method,ωex,nKnots,g,Pθ,complex):
+    "Cache key for the elementary dipolar kernel"
+    return tuple(_hashable(arg) for arg in (t,r,method,ωex,nKnots,g,Pθ,complex))
+
+@cached(max_size=5, custom_key_maker=_Cgrid_key)
 def _Cgrid(ωr,t,ωex,q,complex):
 #==============================================================================
     "Evaluates the costly 3D powder kernel matrix (cached for speed)"
@@ -265,7 +289,7 @@ def _Cgrid(ωr,t,ωex,q,complex):
     return C
 #==============================================================================
 
-@cached(max_size=100)
+@cached(max_size=100, custom_key_maker=_elementarykernel_key)
 def elementarykernel(t,r,method,ωex,nKnots,g,Pθ,complex):
 #==============================================================================
     "Calculates the elementary dipolar kernel (cached for speed)"
@@ -301,15 +325,25 @@ def elementarykernel(t,r,method,ωex,nKnots,g,Pθ,complex):
             K0 = np.exp(-1j*ɸ)*(C + 1j*S)
 
         else:
-            ɸ = np.outer(np.abs(t), ωr)
-            κ = np.lib.scimath.sqrt(6*ɸ/π)
+            # The real-valued kernel depends only on |t|, evaluate it just once for repeated values 
+            # (e.g. time axes symmetric around zero)
+            tabs, tidx = np.unique(np.abs(t), return_inverse=True)
+            if len(tabs)==len(t):
+                tabs, tidx = np.abs(t), slice(None)
+            ɸ = np.outer(tabs, ωr)
+            # The phase is non-negative, no need for the complex-valued square root
+            κ = np.sqrt(6/π*ɸ)
             S, C = fresnel(κ)
-            K0 = C*np.cos(ɸ) + S*np.sin(ɸ)
+            # K0 = C*cos(ɸ) + S*sin(ɸ), evaluated in-place to avoid temporary arrays
+            K0 = np.multiply(C, np.cos(ɸ), out=C)
+            K0 += np.multiply(S, np.sin(ɸ, out=ɸ), out=S)
+            # Map back onto the full time axis
+            K0, κ = K0[tidx], κ[tidx]
 
         # Supress divide by 0 warning       
         with warnings.catch_warnings(): 
             warnings.simplefilter("ignore")
-            K0 = K0/κ
+            K0 /= κ
 
         # Limit of K0(t,r) as t->0
         K0[t==0] = 1 
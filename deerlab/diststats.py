@@ -95,7 +95,16 @@ def diststats(r, P, Puq=None, verbose=False, threshold=None):
 
     # Auxiliary functions
     # -------------------
-    int = np.trapz(P,r) if not np.all(P==0) else 1
+    # Trapezoidal quadrature weights, such that np.trapz(f,r) = f@quadw
+    quadw = np.zeros(len(r))
+    if len(r)>1:
+        quadw[0] = r[1] - r[0]
+        quadw[-1] = r[-1] - r[-2]
+        quadw[1:-1] = r[2:] - r[:-2]
+        quadw /= 2
+    def integrate(f):
+        return f@quadw
+    int = integrate(P) if not np.all(P==0) else 1
     def normalize(P): 
         return P/int
     # Percentile function
@@ -105,19 +114,20 @@ def diststats(r, P, Puq=None, verbose=False, threshold=None):
         rpctile = np.interp(p/100,cdf,r[index])
         return rpctile
     # Expectation operator function
-    def E(x,P,r):
-        return np.trapz(x*normalize(P),r)
+    def E(x,P):
+        return integrate(x*normalize(P))
 
     # Location estimators
     # -------------------
     # 1st moment  - Mean 
-    meanfcn = lambda P: E(r,P,r)
+    meanfcn = lambda P: E(r,P)
     # Median
     medianfcn = lambda P: pctile(r,P,50)
     # Interquartile mean
     def iqmfcn(P):
         IQrange = (r>pctile(r,P,25)) & (r<pctile(r,P,75))
-        return E(r[IQrange],P[IQrange]/np.trapz(normalize(P)[IQrange],r[IQrange]),r[IQrange]) 
+        PIQ = normalize(P)[IQrange]
+        return np.trapz(r[IQrange]*PIQ,r[IQrange])/np.trapz(PIQ,r[IQrange])
     # Mode
     modefcn = lambda P: r[np.argmax(P)]
     # Modes
@@ -128,32 +138,32 @@ def diststats(r, P, Puq=None, verbose=False, threshold=None):
     # Interquartile range
     iqrfcn = lambda P: pctile(r,P,75) - pctile(r,P,25)
     # Mean absolute deviation
-    madfcn = lambda P: E(abs(r - meanfcn(P)),P,r)
+    madfcn = lambda P: E(abs(r - meanfcn(P)),P)
     # 2nd moment - Variance
-    variancefcn = lambda P: E((r - meanfcn(P))**2,P,r)
+    variancefcn = lambda P: E((r - meanfcn(P))**2,P)
     # 2nd moment - Standard deviation
     stdfcn = lambda P: np.sqrt(variancefcn(P))
     # Entropy (information theory)
-    entropyfcn = lambda P: -E(np.log(np.maximum(np.finfo(float).eps,normalize(P))),P,r)
+    entropyfcn = lambda P: -E(np.log(np.maximum(np.finfo(float).eps,normalize(P))),P)
 
     # Shape estimators
     # ----------------
     # Modality
     modalityfcn = lambda P:  np.size(modesfcn(P))
     # 3rd moment - Skewness
-    skewnessfcn = lambda P: E(((r - meanfcn(P))/stdfcn(P))**3,P,r)
+    skewnessfcn = lambda P: E(((r - meanfcn(P))/stdfcn(P))**3,P)
     # 4th moment - Kurtosis
-    kurtosisfcn = lambda P: E(((r - meanfcn(P))/stdfcn(P))**4,P,r)
+    kurtosisfcn = lambda P: E(((r - meanfcn(P))/stdfcn(P))**4,P)
     # Excess kurtosis 
-    exkurtosisfcn = lambda P: 3 - E(((r - meanfcn(P))/stdfcn(P))**4,P,r)
+    exkurtosisfcn = lambda P: 3 - E(((r - meanfcn(P))/stdfcn(P))**4,P)
         
     # 0th moment  - Integral 
-    intfcn = lambda P: np.trapz(P,r)
+    intfcn = lambda P: integrate(P)
 
     # Calculate distribution estimators
     estimators = {
-        'rmin': min(r),
-        'rmax': max(r),
+        'rmin': np.min(r),
+        'rmax': np.max(r),
         'int': intfcn(P),
         'mean': meanfcn(P),
         'median': medianfcn(P),
@@ -230,7 +240,7 @@ def _print_estimators(r,estimators,uq):
         print('-------------------------------------------------')
         print('Distribution Statistics')
         print('-------------------------------------------------')
-        print(f'Range                    {min(r):.2f}-{max(r):.2f} nm')
+        print(f'Range                    {np.min(r):.2f}-{np.max(r):.2f} nm')
         print(f'Integral                 {estimators["int"]:.2f}')
         print('-------------------------------------------------')
         print('Location')
@@ -257,12 +267,12 @@ def _print_estimators(r,estimators,uq):
         print('-------------------------------------------------')
         print('Distribution Statistics')
         print('-------------------------------------------------')
-        print(f'Range                    {min(r):.2f}-{max(r):.2f} nm')
+        print(f'Range                    {np.min(r):.2f}-{np.max(r):.2f} nm')
         print(f'Integral                 {estimators["int"]:.2f}')
         print('-------------------------------------------------')
         print('Location')
         print('-------------------------------------------------')
-        print(f'Range                    {min(r):.2f}-{max(r):.2f} nm')
+        print(f'Range                    {np.min(r):.2f}-{np.max(r):.2f} nm')
         print(f'Mean                     {estimators["mean"]:.2f} ({uq["mean"].ci(95)[0]:.2f},{uq["mean"].ci(95)[1]:.2f}) nm')
         print(f'Median                   {estimators["median"]:.2f} ({uq["median"].ci(95)[0]:.2f},{uq["median"].ci(95)[1]:.2f}) nm')
         print(f'Interquartile mean       {estimators["iqm"]:.2f} ({uq["iqm"].ci(95)[0]:.2f},{uq["iqm"].ci(95)[1]:.2f}) nm')
@@ -9,7 +9,7 @@ from scipy.optimize import fminbound
 from deerlab.solvers import snlls
 from deerlab.classes import FitResult, UQResult
 from deerlab.bootstrap_analysis import bootstrap_analysis
-from deerlab.utils import formatted_table, parse_multidatasets
+from deerlab.utils import formatted_table, parse_multidatasets, Jacobian
 import inspect 
 from copy import copy,deepcopy
 from functools import partial
@@ -279,10 +279,18 @@ class Model():
     #                                    Private methods
     #=======================================================================================
 
+    #---------------------------------------------------------------------------------------
+    def _parameter_names(self):
+        "Get the names of the parameter attributes of the model sorted alphabetically"
+        # Parameters are always instance attributes, scanning the instance dictionary avoids 
+        # the costly dir() and attribute lookups on every model evaluation
+        return sorted([key for key,value in vars(self).items() if isinstance(value,Parameter)])
+    #---------------------------------------------------------------------------------------
+
     #---------------------------------------------------------------------------------------
     def _parameter_list(self, order='alphabetical'):
         "Get the list of parameters defined in the model sorted alphabetically or by vector definition"
-        keylist = [param for param in dir(self) if isinstance(getattr(self,param),Parameter)]
+        keylist = self._parameter_names()
         if order=='alphabetical':
             pass
         elif order=='vector':
@@ -303,7 +311,7 @@ class Model():
     def _vecsort(self, paramlist):
         "Sort vectorized parameters attributes from alphabetical ordering to vector indexing"
         paramlist = np.squeeze(np.atleast_1d(paramlist))
-        indices = np.concatenate([np.atleast_1d(getattr(self,param).idx) for param in dir(self) if isinstance(getattr(self,param),Parameter)])
+        indices = np.concatenate([np.atleast_1d(getattr(self,param).idx) for param in self._parameter_names()])
         orderedlist = np.atleast_1d(paramlist.copy())
         orderedlist[indices] = paramlist
 
@@ -314,7 +322,7 @@ class Model():
     def _split_linear(self,variable):
         "Split a vector in non-linear and linear parameter subset vectors"
         variable = np.atleast_1d(variable)
-        linear = np.concatenate([np.atleast_1d(getattr(self,param).linear) for param in dir(self) if isinstance(getattr(self,param),Parameter)])
+        linear = np.concatenate([np.atleast_1d(getattr(self,param).linear) for param in self._parameter_names()])
         linear = self._vecsort(linear)
         variable_nonlin = variable[~linear]
         variable_lin = variable[linear]
@@ -325,7 +333,7 @@ class Model():
     def _merge_linear(self,variable_nonlin,variable_lin):
         "Merge a vector's non-linear and linear parameter subset vectors"
         variable = np.zeros(len(variable_nonlin)+len(variable_lin))
-        linear = np.concatenate([np.atleast_1d(getattr(self,param).linear) for param in dir(self) if isinstance(getattr(self,param),Parameter)])
+        linear = np.concatenate([np.atleast_1d(getattr(self,param).linear) for param in self._parameter_names()])
         linear = self._vecsort(linear)
         variable[~linear] = variable_nonlin
         variable[linear] = variable_lin
@@ -335,7 +343,7 @@ class Model():
     #---------------------------------------------------------------------------------------
     def _getvector(self,attribute):
         "Get the list of parameters attributes defined in the model sorted alphabetically"
-        return np.concatenate([np.atleast_1d(getattr(getattr(self,param),attribute)) for param in dir(self) if isinstance(getattr(self,param),Parameter)])
+        return np.concatenate([np.atleast_1d(getattr(getattr(self,param),attribute)) for param in self._parameter_names()])
     #---------------------------------------------------------------------------------------
 
     #-----------------------------------------------------------------------------
@@ -547,7 +555,7 @@ class Model():
         y = A@θlin
 
         # Evaluate whether the response has 
-        if hasattr(self,'_posteval_fcn'):
+        if '_posteval_fcn' in vars(self):
             y = self._posteval_fcn(y,*constants,*θ)
         return y
     #---------------------------------------------------------------------------------------
@@ -831,11 +839,51 @@ def _propagate(fitresults,params,_paramlist,paramidx,model,*constants,lb=None,ub
             raise KeyError(f'The fit object does not contain the {param} parameter.')
     # Determine the indices of the subset of parameters the model depends on
     subset = [paramidx[np.where(np.asarray(_paramlist)==param)[0][0]] for param in modelparam]
+    # Models are linear with respect to their linear parameters, use the analytical Jacobian for those
+    if isinstance(model,Model) and model.Nlin>0 and '_posteval_fcn' not in vars(model):
+        jacobian = lambda param: _model_jacobian(model,constants,subset,param)
+    else:
+        jacobian = None
     # Propagate the uncertainty from that subset to the model
-    modeluq = fitresults.paramUncert.propagate(lambda param: model(*constants,*[param[s] for s in subset]),lb,ub)
+    modeluq = fitresults.paramUncert.propagate(lambda param: model(*constants,*[param[s] for s in subset]),lb,ub,jacobian=jacobian)
     return modeluq
 # ----------------------------------------------------------------------------
 
+def _model_jacobian(model,constants,subset,param):
+# ----------------------------------------------------------------------------
+    """
+    Jacobian of a model's response with respect to the parameter vector ``param``, from which the
+    model parameters are taken according to ``subset``. The columns of the linear parameters are 
+    given by the design matrix, only those of the non-linear parameters are estimated via finite differences.
+    """
+    θ = np.concatenate([np.atleast_1d(param[s]) for s in subset])
+    θlin, θnonlin = model._split_linear(θ)
+    linear, nonlinear = model._split_linear(np.arange(model.Nparam))
+    _,lb = model._split_linear(model._vecsort(model._getvector('lb')))
+    _,ub = model._split_linear(model._vecsort(model._getvector('ub')))
+
+    def designmatrix(θnonlin):
+        A = np.atleast_2d(model.nonlinmodel(*constants,*θnonlin))
+        if A.shape[1]!=len(θlin): 
+            A = A.T
+        # Complex-valued responses are propagated as concatenated real and imaginary parts
+        if np.iscomplexobj(A):
+            A = np.concatenate([A.real,A.imag])
+        return A
+
+    # Jacobian with respect to the model parameters
+    A = designmatrix(θnonlin)
+    Jθ = np.zeros((A.shape[0],model.Nparam))
+    Jθ[:,linear] = A
+    if len(θnonlin)>0:
+        Jθ[:,nonlinear] = Jacobian(lambda θnonlin: designmatrix(θnonlin)@θlin,θnonlin,lb,ub,f0=A@θlin)
+
+    # Jacobian with respect to the full parameter vector
+    J = np.zeros((A.shape[0],len(param)))
+    np.add.at(J.T,np.concatenate([np.atleast_1d(s) for s in subset]),Jθ.T)
+    return J
+# ----------------------------------------------------------------------------
+
 def _evaluate(params,model,*constants):
 # ----------------------------------------------------------------------------
     """
@@ -913,9 +961,8 @@ def _print_fitresults(fitresult,model):
             if np.any(getattr(model,param).frozen): 
                 # If parameter is frozen, print just the value
                 value = getattr(model,param).value
-                try:
-                    if isinstance(value, (list, tuple, np.ndarray)): value = value[0]
-                except: pass
+                if isinstance(value, (list, tuple, np.ndarray)) and np.size(value)>0: 
+                    value = np.ravel(value)[0]
                 value = f'{value:.3f}' if value<1e4 else f'{value:.3g}'
                 ci = '(frozen)'
             else:
@@ -1115,14 +1162,15 @@ def fit(model_, y, *constants, par0=None, penalties=None, bootstrap=0, noiselvl=
         extrapenalties = lambda *_: None
 
     # Prepare the separable non-linear least-squares solver
-    Amodel_fcn = lambda param: model.nonlinmodel(*constants,*param)
-    fitfcn = lambda y,penweights: snlls(y, Amodel_fcn, par0, lb=lb, ub=ub, lbl=lbl, ubl=ubl, mask=mask, weights=weights, 
+    Amodel_fcn = lambda param, nonlinmodel=model.nonlinmodel, constants=constants: nonlinmodel(*constants,*param)
+    def snlls_fcn(par0):
+        return lambda y,penweights: snlls(y, Amodel_fcn, par0, lb=lb, ub=ub, lbl=lbl, ubl=ubl, mask=mask, weights=weights, 
                                                 subsets=ysubsets, lin_frozen=linfrozen, nonlin_frozen=nonlinfrozen,
                                                 regparam=regparam, reg=reg, regparamrange=regparamrange, noiselvl=noiselvl,
                                                 extrapenalty=extrapenalties(penweights), **kwargs)        
 
     # Prepare outer optimization of the penalty weights, if necessary
-    fitfcn = _outerOptimization(fitfcn,penalties,y,sigmas)
+    fitfcn = _outerOptimization(snlls_fcn(par0),penalties,y,sigmas)
 
     # Run the fitting algorithm 
     fitresults = fitfcn(y)
@@ -1130,8 +1178,13 @@ def fit(model_, y, *constants, par0=None, penalties=None, bootstrap=0, noiselvl=
 
     # If requested, perform a bootstrap analysis
     if bootstrap>0: 
+        # Warm-start the fits of the resampled data at the fitted non-linear parameters
+        if fitresults.nonlin is not None and len(fitresults.nonlin)>0:
+            bootfitfcn = _outerOptimization(snlls_fcn(fitresults.nonlin),penalties,y,sigmas)
+        else:
+            bootfitfcn = fitfcn
         def bootstrap_fcn(ysim): 
-            fit = fitfcn(np.concatenate(ysim))
+            fit = bootfitfcn(np.concatenate(ysim))
             if not isinstance(fit.model,list): fit.model = [fit.model]
             return (fit.param,*fit.model)
         # Bootstrapped uncertainty quantification
@@ -1173,7 +1226,7 @@ def fit(model_, y, *constants, par0=None, penalties=None, bootstrap=0, noiselvl=
                     non_normalized = FitResult_param_[key] # Non-normalized value
                     FitResult_param_[key] = param.normalization(FitResult_param_[key]) # Normalized value
                     FitResult_param_[f'{key}_scale'] = np.mean(non_normalized/FitResult_param_[key]) # Normalization factor
-                    FitResult_paramuq_[f'{key}Uncert'] = FitResult_paramuq_[f'{key}Uncert'].propagate(lambda x: x/FitResult_param_[f'{key}_scale'], lb=param.lb, ub=param.ub) # Normalization of the uncertainty
+                    FitResult_paramuq_[f'{key}Uncert'] = FitResult_paramuq_[f'{key}Uncert'].rescale(1/FitResult_param_[f'{key}_scale'], lb=param.lb, ub=param.ub) # Normalization of the uncertainty
                     FitResult_paramuq_[f'{key}_scaleUncert'] = UQResult('void')
     if len(noiselvl)==1: 
         noiselvl = noiselvl[0]
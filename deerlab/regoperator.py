@@ -43,9 +43,10 @@ def regoperator(r,d=2,includeedges=False):
     L = np.zeros((n-d,n))
 
     # Compute non-zero finite forward difference coefficients via Fornberg's method
-    for i in range(n-d):
-        cols = np.arange(i,i+d+1,1)
-        L[i,cols] = _fdcoeffF(d,r[i],r[cols])
+    # (evaluated for all rows at once, each row using the stencil r[i:i+d+1])
+    rows = np.arange(n-d)
+    cols = rows[:,np.newaxis] + np.arange(d+1)
+    L[rows[:,np.newaxis],cols] = _fdcoeffF(d,r[rows],r[cols])
 
     # Introduce missing rows to account for edges of axis
     if includeedges:
@@ -81,6 +82,10 @@ def _fdcoeffF(k,xbar,x):
     This program should give the same results as fdcoeffV.m, but for large
     values of n is much more stable numerically.
 
+    The coefficients for multiple stencils can be computed at once by passing 
+    an array of points xbar and a 2D-array x, where each row contains the grid 
+    values of the corresponding stencil.
+
     Based on the program "weights" in
     B. Fornberg, "Calculation of weights in finite difference formulas",
     SIAM Review 40 (1998), pp. 685-691.
@@ -99,36 +104,38 @@ def _fdcoeffF(k,xbar,x):
     From  http://www.amath.washington.edu/~rjl/fdmbook/  (2007)
     """
 
-    n = len(x)
+    x = np.asarray(x)
+    xbar = np.asarray(xbar)
+    n = x.shape[-1]
     if k >= n:
         raise TypeError('Numer of elements in x must be larger than k')
 
 
     m = k
     c1 = 1
-    c4 = x[0] - xbar
-    C = np.zeros((n,m+1))
-    C[0,0] = 1
+    c4 = x[...,0] - xbar
+    C = np.zeros(x.shape + (m+1,))
+    C[...,0,0] = 1
     for i in range(n-1):
         i1 = i+1
         mn = min(i,m)
         c2 = 1
         c5 = c4
-        c4 = x[i1] - xbar
+        c4 = x[...,i1] - xbar
         for j in range(i+1):
             j1 = j
-            c3 = x[i1] - x[j1]
+            c3 = x[...,i1] - x[...,j1]
             c2 = c2*c3
             if j==i:
                 for s in range(mn+1,0,-1):
                     s1 = s
-                    C[i1,s1] = c1*(s*C[i1-1,s1-1] - c5*C[i1-1,s1])/c2
-                C[i1,0] = -c1*c5*C[i1-1,0]/c2
+                    C[...,i1,s1] = c1*(s*C[...,i1-1,s1-1] - c5*C[...,i1-1,s1])/c2
+                C[...,i1,0] = -c1*c5*C[...,i1-1,0]/c2
             for s in range(mn+1,0,-1):
                 s1 = s
-                C[j1,s1] = (c4*C[j1,s1] - s*C[j1,s1-1])/c3
-            C[j1,0] = c4*C[j1,0]/c3
+                C[...,j1,s1] = (c4*C[...,j1,s1] - s*C[...,j1,s1-1])/c3
+            C[...,j1,0] = c4*C[...,j1,0]/c3
         c1 = c2
     # Last column of c gives desired row vector
-    c = C[:,-1]           
+    c = C[...,-1]           
     return c
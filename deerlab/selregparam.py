@@ -5,11 +5,13 @@
 
 import numpy as np 
 import scipy.optimize as opt
+from scipy.linalg import cho_factor, cho_solve, LinAlgError
 import math as m
+from joblib import Parallel, delayed
 import deerlab as dl
 
 def selregparam(y, A, solver, method='aic', algorithm='brent', noiselvl=None,
-                searchrange=[1e-8,1e2],regop=None, weights=None, full_output=False, candidates=None):
+                searchrange=[1e-8,1e2],regop=None, weights=None, full_output=False, candidates=None, early_stop=False, cores=1):
     r"""
     Selection of optimal regularization parameter based on a selection criterion.
 
@@ -77,6 +79,17 @@ def selregparam(y, A, solver, method='aic', algorithm='brent', noiselvl=None,
         Estimate of the noise standard deviation, if not specified it is estimated automatically.
         Used for the MCL selection method.  
 
+    early_stop : boolean, optional
+        If enabled, the ``'grid'`` algorithm evaluates the candidates in ascending order and stops once the selection 
+        functional has increased for two consecutive candidates (a patience of two). This assumes the functional is 
+        unimodal over the candidates; for a functional with several local minima, the global optimum may be missed. 
+        Not used by the L-curve methods, which require the full grid. The default is False.
+
+    cores : scalar, optional
+        Number of CPU cores/processes used to evaluate the candidates of the ``'grid'`` algorithm in parallel. 
+        If ``cores=1`` no parallel computing is used. If ``cores=-1`` all available CPUs are used. Not used if 
+        ``early_stop`` is enabled, since the candidates are then evaluated sequentially. The default is one core.
+
     Returns
     -------
     alphaopt : scalar
@@ -108,8 +121,13 @@ def selregparam(y, A, solver, method='aic', algorithm='brent', noiselvl=None,
     else: 
         L = regop
 
+    # Precompute the regularization-independent LSQ components
+    AtA, Aty = dl.solvers._lsqcomponents(y,A,weights=weights)
+    LtL = L.T@L
+    wA = A if np.all(weights==1) else weights[:,np.newaxis]*A
+
     # Create function handle
-    evalalpha = lambda alpha: _evalalpha(alpha, y, A, L, solver, method, noiselvl, weights)
+    evalalpha = lambda alpha: _evalalpha(alpha, y, A, L, solver, method, noiselvl, weights, AtA, Aty, LtL, wA)
 
     # Evaluate functional over search range, using specified search method
     if algorithm == 'brent':
@@ -144,8 +162,28 @@ def selregparam(y, A, solver, method='aic', algorithm='brent', noiselvl=None,
         else: 
             alphaCandidates = np.atleast_1d(candidates)
 
-        # Evaluate the full grid of alpha-candidates 
-        functional,residuals,penalties,alphas_evaled = tuple(zip(*[evalalpha(alpha) for alpha in alphaCandidates]))
+        if early_stop and method not in ['lr','lc']:
+            # Evaluate the alpha-candidates until the functional increases for consecutive candidates
+            patience = 2
+            evaluations = []
+            increases = 0
+            for alpha in np.sort(alphaCandidates):
+                evaluations.append(evalalpha(alpha))
+                if len(evaluations)>1 and evaluations[-1][0]>evaluations[-2][0]:
+                    increases += 1
+                else:
+                    increases = 0
+                if increases>=patience:
+                    break
+            functional,residuals,penalties,alphas_evaled = tuple(zip(*evaluations))
+            alphaCandidates = np.asarray(alphas_evaled)
+        else:
+            # Evaluate the full grid of alpha-candidates, in series (cores=1) or in parallel (cores>1)
+            if cores==1:
+                evaluations = [evalalpha(alpha) for alpha in alphaCandidates]
+            else:
+                evaluations = Parallel(n_jobs=cores)(delayed(evalalpha)(alpha) for alpha in alphaCandidates)
+            functional,residuals,penalties,alphas_evaled = tuple(zip(*evaluations))
 
         # If an L-curve method is requested evaluate it now with the full grid:
         
@@ -178,22 +216,30 @@ def selregparam(y, A, solver, method='aic', algorithm='brent', noiselvl=None,
 
 
 #=========================================================
-def _evalalpha(alpha,y,A,L,solver,selmethod,noiselvl,weights):
+def _evalalpha(alpha,y,A,L,solver,selmethod,noiselvl,weights,AtA,Aty,LtL,wA):
     "Evaluation of the selection functional at a given regularization parameter value"
 
-    # Prepare LSQ components
-    AtAreg, Aty = dl.solvers._lsqcomponents(y,A,L,alpha,weights)
-    wA = weights[:,np.newaxis]*A
+    # Regularized LSQ components from the precomputed terms
+    AtAreg = alpha**2*LtL
+    AtAreg += AtA
     # Solve linear LSQ problem
     P = solver(AtAreg,Aty)
 
-    # Moore-PeNose pseudoinverse
-    pA = np.linalg.inv(AtAreg)@wA.T
-    # Influence matrix
-    H = wA@pA
-
-    # Residual term
-    residuals = weights*(A@P - y)
+    # Moore-PeNose pseudoinverse, via Cholesky factorization of the (symmetric) normal equations
+    try:
+        pA = cho_solve(cho_factor(AtAreg,check_finite=False),wA.T,check_finite=False)
+    except LinAlgError:
+        pA = np.linalg.inv(AtAreg)@wA.T
+    # Diagonal of the influence matrix H = wA@pA
+    Hdiag = np.einsum('ij,ji->i',wA,pA)
+    traceH = np.sum(Hdiag)
+    # Full influence matrix, only if required by the selection method
+    if selmethod in ['rm','gml']:
+        H = wA@pA
+
+    # Residual term (in the promoted dtype of all operands)
+    residuals = np.subtract(A@P, y, dtype=np.result_type(A, y, weights))
+    residuals *= weights
     Residual = np.linalg.norm(residuals)
     # Regularization penalty term
     Penalty = np.linalg.norm(L@P)
@@ -206,36 +252,36 @@ def _evalalpha(alpha,y,A,L,solver,selmethod,noiselvl,weights):
 
     # Cross validation (CV)
     if  selmethod =='cv': 
-        f_ = sum(abs(residuals/(np.ones(N) - np.diag(H)))**2)
+        f_ = np.sum(np.abs(residuals/(1 - Hdiag))**2)
             
     # Generalized Cross Validation (GCV)
     elif  selmethod =='gcv': 
-        f_ = Residual**2/((1 - np.trace(H)/N)**2)
+        f_ = Residual**2/((1 - traceH/N)**2)
             
     # Robust Generalized Cross Validation (rGCV)
     elif  selmethod =='rgcv': 
         tuning = 0.9
-        f_ = Residual**2/((1 - np.trace(H)/N)**2)*(tuning + (1 - tuning)*np.trace(H**2)/N)
+        f_ = Residual**2/((1 - traceH/N)**2)*(tuning + (1 - tuning)*np.sum(Hdiag**2)/N)
             
     # Strong Robust Generalized Cross Validation (srGCV)
     elif  selmethod =='srgcv':
         tuning = 0.8
-        f_ = Residual**2/((1 - np.trace(H)/N)**2)*(tuning + (1 - tuning)*np.trace(pA.T@pA)/N)
+        f_ = Residual**2/((1 - traceH/N)**2)*(tuning + (1 - tuning)*np.sum(pA**2)/N)
             
     # Akaike information criterion (AIC)
     elif  selmethod =='aic': 
         crit = 2
-        f_ = N*np.log(Residual**2/N) + crit*np.trace(H)
+        f_ = N*np.log(Residual**2/N) + crit*traceH
             
     # Bayesian information criterion (BIC)
     elif  selmethod =='bic':  
         crit = np.log(N)
-        f_ = N*np.log(Residual**2/N) + crit*np.trace(H)
+        f_ = N*np.log(Residual**2/N) + crit*traceH
             
     # Corrected Akaike information criterion (AICC)
     elif  selmethod =='aicc': 
-        crit = 2*N/(N-np.trace(H)-1)
-        f_ = N*np.log(Residual**2/N) + crit*np.trace(H)
+        crit = 2*N/(N-traceH-1)
+        f_ = N*np.log(Residual**2/N) + crit*traceH
     
     # Residual method (RM)
     elif  selmethod =='rm':
@@ -248,12 +294,14 @@ def _evalalpha(alpha,y,A,L,solver,selmethod,noiselvl,weights):
 
     # Normalized Cumulative Periodogram (NCP)
     elif selmethod == 'ncp': 
-        resPeriodogram = abs(np.fft.fft(residuals))**2
-        wnoisePeriodogram = np.zeros(len(resPeriodogram))
-        respowSpectrum = np.zeros(len(resPeriodogram))
-        for j in range(len(resPeriodogram)-1):
-            respowSpectrum[j]  = np.linalg.norm(resPeriodogram[1:j+1],1)/np.linalg.norm(resPeriodogram[1:-1],1)
-            wnoisePeriodogram[j] = j/(len(resPeriodogram) - 1)
+        resPeriodogram = np.abs(np.fft.fft(residuals))**2
+        Nper = len(resPeriodogram)
+        # Cumulative periodogram of the residuals (last element left at zero)
+        respowSpectrum = np.zeros(Nper)
+        respowSpectrum[1:-1] = np.cumsum(resPeriodogram[1:-1])/np.sum(resPeriodogram[1:-1])
+        # Cumulative periodogram of white noise
+        wnoisePeriodogram = np.zeros(Nper)
+        wnoisePeriodogram[:-1] = np.arange(Nper-1)/(Nper - 1)
         f_ = np.linalg.norm(respowSpectrum - wnoisePeriodogram)
 
     # Generalized Maximum Likelihood (GML)
@@ -266,7 +314,7 @@ def _evalalpha(alpha,y,A,L,solver,selmethod,noiselvl,weights):
 
     # Mallows' C_L (MCL)
     elif  selmethod == 'mcl':  
-        f_ = Residual**2 + 2*noiselvl**2*np.trace(H) - 2*N*noiselvl**2
+        f_ = Residual**2 + 2*noiselvl**2*traceH - 2*N*noiselvl**2
         
     elif selmethod == 'lr' or selmethod == 'lc':
         f_ = 0
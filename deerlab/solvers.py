@@ -8,10 +8,12 @@ import numpy as np
 import cvxopt as cvx
 import matplotlib.pyplot as plt
 from scipy.optimize import least_squares, lsq_linear
+from scipy.linalg import cho_factor, cho_solve, get_lapack_funcs, LinAlgError
 # DeerLab dependencies
 import deerlab as dl
 from deerlab.classes import UQResult, FitResult
 from deerlab.utils import multistarts, hccm, parse_multidatasets, goodness_of_fit, Jacobian, isempty
+from deerlab.utils.gof import _gof_statistics
 import time 
 from functools import partial
 
@@ -129,11 +131,8 @@ def _check_frozen(frozen,N=None,par0=None):
         frozen = np.full(N,False)
         xfrozen = np.full(N,None)
     else:
-        frozen = np.atleast_1d(frozen.copy())
-        xfrozen = frozen.copy()
-        frozen[np.where(frozen!=None)[0]] = True
-        frozen[np.where(frozen==None)[0]] = False
-        frozen = frozen.astype(bool)
+        xfrozen = np.array(frozen,ndmin=1)
+        frozen = xfrozen!=None
     return frozen,xfrozen
 # ===========================================================================================
 
@@ -147,14 +146,15 @@ def _lsqcomponents(V, K, L=None, alpha=0, weights=None):
     Calculate the components needed for the linear least-squares (LSQ) solvers. 
     """
     
-    if weights is None:
-        weights = np.ones_like(V)
+    # Weight the components only if needed, avoiding a copy of the design matrix for unit weights
+    if weights is None or np.all(weights==1):
+        Kw, Vw = K, V
     else:
         weights = np.atleast_1d(weights)
+        Kw = weights[:,np.newaxis]*K
+        Vw = weights*V
         
     # Compute components of the LSQ normal equations
-    Kw = weights[:,np.newaxis]*K
-    Vw = weights*V
     KtK = Kw.T@Kw
     KtV = Kw.T@Vw
     
@@ -162,10 +162,12 @@ def _lsqcomponents(V, K, L=None, alpha=0, weights=None):
     if L is None:
         return KtK, KtV
     
-    # Compute the regularization term
-    regterm = L.T@L
+    # Compute the regularization term in the promoted dtype of all operands (e.g. integer K with float alpha)
+    regterm = np.multiply(L.T@L, alpha**2, dtype=np.result_type(KtK,L,alpha))
     
-    KtKreg = KtK + alpha**2*regterm
+    # Accumulate the normal equations in-place into the regularization term to avoid temporary arrays
+    regterm += KtK
+    KtKreg = regterm
     
     return KtKreg, KtV
 # ==============================================================================================
@@ -207,7 +209,7 @@ def _prepare_linear_lsq(A,lb,ub,reg,L,tol,maxiter,nnlsSolver):
     # ----------------------------------------------------------
     if not linearConstrained:
         # Unconstrained linear LSQ
-        linSolver = np.linalg.solve
+        linSolver = _spd_solve
         parseResult = lambda result: result
 
     elif linearConstrained and not nonNegativeOnly:
@@ -230,19 +232,38 @@ def _prepare_linear_lsq(A,lb,ub,reg,L,tol,maxiter,nnlsSolver):
 # ===========================================================================================
 
 # ===========================================================================================
-def _model_evaluation(ymodels,parfit,paruq,uq):
+def _spd_solve(AtA,Aty):
+    """
+    Symmetric positive-definite solver
+    ==================================
+
+    Solves the normal equations via a direct call to the LAPACK Cholesky-based solver (posv),
+    falling back to a general LU-based solve if the matrix is not positive definite.
+    """
+    posv, = get_lapack_funcs(('posv',),(AtA,Aty))
+    _,x,info = posv(AtA,Aty)
+    if info!=0:
+        x = np.linalg.solve(AtA,Aty)
+    return x
+# ===========================================================================================
+
+# ===========================================================================================
+def _model_evaluation(ymodels,parfit,paruq,uq,jacobians=None):
     """
     Model evaluation
     ================
 
     Evaluates the model(s) response(s) at the fitted solution and progates the uncertainty in the fit
-    parameters to the model response. 
+    parameters to the model response. If given, the Jacobians of the model(s) are used for the 
+    uncertainty propagation instead of their finite-difference estimates. 
     """
+    if jacobians is None:
+        jacobians = [None]*len(ymodels)
     modelfit, modelfituq = [],[]
-    for ymodel in ymodels: 
+    for ymodel,jacobian in zip(ymodels,jacobians): 
         modelfit.append(ymodel(parfit))
         if uq: 
-            modelfituq.append(paruq.propagate(ymodel))
+            modelfituq.append(paruq.propagate(ymodel,jacobian=jacobian))
         else:
             modelfituq.append(UQResult('void'))
     return modelfit, modelfituq
@@ -257,11 +278,20 @@ def _goodness_of_fit_stats(ys,yfits,noiselvl,nParam):
     Evaluates a series of statistical criteria for the goodness-of-fit of a list of dataset
     and returns a list of dictionaries with the statistics for each dataset.
     """
-    stats = []
-    for y,yfit,sigma in zip(ys,yfits,noiselvl):
-        Ndof = len(y) - nParam
-        stats.append(goodness_of_fit(y, yfit, Ndof, sigma))
-    return stats 
+    if len(ys)==1:
+        return [goodness_of_fit(ys[0], yfits[0], len(ys[0]) - nParam, noiselvl[0])]
+
+    # Compute the sums of squares of all datasets in a single pass over the concatenated data
+    Ns = np.array([len(y) for y in ys])
+    offsets = np.concatenate(([0],np.cumsum(Ns)[:-1]))
+    yfit = np.concatenate(yfits)
+    res = np.concatenate(ys) - yfit
+    SSres = np.add.reduceat(res**2,offsets)
+    normres = np.add.reduceat(np.abs(res)**2,offsets) if np.iscomplexobj(res) else SSres
+    yfitmeans = np.add.reduceat(yfit,offsets)/Ns
+    SStot = np.add.reduceat((yfit - np.repeat(yfitmeans,Ns))**2,offsets)
+
+    return [_gof_statistics(N, N - nParam, sigma, *sums) for N,sigma,*sums in zip(Ns,noiselvl,SSres,normres,SStot)]
 # ===========================================================================================
 
 def _penalty_augmentation(alpha,L,P,type):
@@ -307,17 +337,19 @@ def _optimize_scale(y,yfit,subsets):
 # ===========================================================================================
 def _unfrozen_subset(param,frozen,parfrozen):
     param,frozen,parfrozen = np.atleast_1d(param,frozen,parfrozen)
-    param = param.tolist()
     # Account for frozen parameters
-    param = np.atleast_1d([parfrozen[n] if frozen[n] else param.pop(0) for n in range(len(frozen))])
-    return param
+    _param = np.zeros(len(frozen))
+    _param[frozen] = parfrozen[frozen]
+    if not np.all(frozen):
+        _param[~frozen] = param
+    return _param
 # ===========================================================================================
 
 # ===========================================================================================
 def _unfrozen_subset_inv(param,frozen):
     param,frozen = np.atleast_1d(param,frozen)
     # Account for frozen parameters
-    return np.atleast_1d([param[n] for n in range(len(frozen)) if not frozen[n] ])
+    return param[~frozen].astype(float)
 # ===========================================================================================
 
 
@@ -547,8 +579,8 @@ def snlls(y, Amodel, par0=None, lb=None, ub=None, lbl=None, ubl=None, nnlsSolver
     y, Amodel, weights, mask, subsets, noiselvl = parse_multidatasets(y, Amodel, weights, noiselvl, masks=mask, subsets=subsets)    
     
     if not callable(Amodel):
-        Amatrix = Amodel.copy()
-        Amodel = lambda _: Amatrix
+        # No copy needed, the design matrix is never modified in-place
+        Amodel = lambda _, Amatrix=np.asarray(Amodel): Amatrix
         par0 = np.array([])
 
     if regparamrange is None: 
@@ -557,8 +589,7 @@ def snlls(y, Amodel, par0=None, lb=None, ub=None, lbl=None, ubl=None, nnlsSolver
     # Get info on the problem parameters and non-linear operator
     A0 = Amodel(par0)
     if len(np.shape(A0))!=2:
-        Amodel_ = Amodel
-        Amodel = lambda p: np.atleast_2d(Amodel_(p)).T
+        Amodel = lambda p, Amodel_=Amodel: np.atleast_2d(Amodel_(p)).T
         A0 = Amodel(par0)
 
     if np.shape(A0)[0]!=np.shape(y)[0]:
@@ -576,7 +607,9 @@ def snlls(y, Amodel, par0=None, lb=None, ub=None, lbl=None, ubl=None, nnlsSolver
     Amodel__ = Amodel
     if np.iscomplexobj(A0):
        # If the design matrix is complex-valued
-        Amodel = lambda p: np.concatenate([Amodel__(p).real,Amodel__(p).imag]) 
+        def Amodel(p, Amodel__=Amodel__):
+            A = Amodel__(p)
+            return np.concatenate([A.real,A.imag])
         A0 = np.concatenate([A0.real,A0.imag]) 
         A0 = Amodel(par0)
         if not complexy: 
@@ -586,8 +619,11 @@ def snlls(y, Amodel, par0=None, lb=None, ub=None, lbl=None, ubl=None, nnlsSolver
             mask = np.concatenate([mask,mask])      
     elif complexy:
         # If the design matrix is not complex-valued, but the data is
-        Amodel = lambda p: np.concatenate([Amodel__(p),np.zeros_like(A0)]) 
+        Amodel = lambda p, Amodel__=Amodel__, Azeros=np.zeros_like(A0): np.concatenate([Amodel__(p),Azeros]) 
 
+    # If no data points are masked out, index via a slice to obtain views instead of copies
+    if np.all(mask):
+        mask = slice(None)
 
     Nnonlin = len(par0)
     Nlin = np.shape(A0)[1]
@@ -617,7 +653,7 @@ def snlls(y, Amodel, par0=None, lb=None, ub=None, lbl=None, ubl=None, nnlsSolver
     # Redefine model to take just the unfrozen parameter subset
 
     _Amodel = Amodel
-    Amodel = lambda param: _Amodel(_unfrozen_subset(param,nonlin_frozen,nonlin_parfrozen))
+    Amodel = lambda param, _Amodel=_Amodel, frozen=nonlin_frozen, parfrozen=nonlin_parfrozen: _Amodel(_unfrozen_subset(param,frozen,parfrozen))
 
     if includeExtrapenalty:
         extrapenalty_ = [penalty for penalty in extrapenalty]
@@ -656,7 +692,7 @@ def snlls(y, Amodel, par0=None, lb=None, ub=None, lbl=None, ubl=None, nnlsSolver
             return lin_parfrozen.astype(float), None, 0
 
         # Remove columns corresponding to frozen linear parameters 
-        Ared = A[:,~lin_frozen]
+        Ared = A[:,~lin_frozen] if Nlin_notfrozen<Nlin else A
         # Frozen component of the model response
         yfrozen = (A[:,lin_frozen]@lin_parfrozen[lin_frozen]).astype(float)
 
@@ -669,7 +705,9 @@ def snlls(y, Amodel, par0=None, lb=None, ub=None, lbl=None, ubl=None, nnlsSolver
         # Components for linear least-squares
         AtA, Aty = _lsqcomponents((y-yfrozen)[mask], Ared[mask,:], L, alpha, weights=weights[mask])
 
-        Ndof = np.maximum(0,np.trace(Ared@np.linalg.pinv(AtA)))
+        # Trace of Ared@pinv(AtA), without forming the full matrix product
+        Ndiag = min(np.shape(Ared))
+        Ndof = np.maximum(0,np.einsum('ij,ji->',Ared[:Ndiag,:],np.linalg.pinv(AtA)[:,:Ndiag]))
 
         # Solve the linear least-squares problem
         result = linSolver(AtA, Aty)
@@ -702,7 +740,7 @@ def snlls(y, Amodel, par0=None, lb=None, ub=None, lbl=None, ubl=None, nnlsSolver
             if type(regparam) is str:
                 if Nnonlin_notfrozen>0:
                     # If the parameter vector has not changed by much...
-                    if check and all(abs(par_prev-p)/(p+np.finfo(np.float64).eps) < alphareopt):
+                    if check and np.all(np.abs(par_prev-p)/(p+np.finfo(np.float64).eps) < alphareopt):
                         # ...use the alpha optimized in the previous iteration
                         optimize_alpha = False
                         alpha = regparam_prev
@@ -729,8 +767,9 @@ def snlls(y, Amodel, par0=None, lb=None, ub=None, lbl=None, ubl=None, nnlsSolver
         xfit,alpha,Ndof_lin = linear_problem(y,A,optimize_alpha,alpha)
         regparam_prev = alpha
 
-        # Compute residual vector
-        res = weights*(Amodel(p)@xfit - y)
+        # Compute residual vector (in the promoted dtype of all operands)
+        res = np.subtract(A@xfit, y, dtype=np.result_type(A, y, weights))
+        res *= weights
 
         # Apply mask to residual
         res = res[mask]
@@ -757,23 +796,11 @@ def snlls(y, Amodel, par0=None, lb=None, ub=None, lbl=None, ubl=None, nnlsSolver
 
         if verbose>0: 
             print(f'{timestamp()} Linear least-squares routine in progress...')
-    
-        if type(regparam) is str and includeRegularization:
-            # Optimized regularization parameter
-            alpha = regparam
-            optimize_alpha = True
-        else:
-            # Fixed regularization parameter
-            alpha = regparam
-            optimize_alpha = False
 
-        # Solve the linear LSQ problem
-        linfit, alpha, Ndof_lin = linear_problem(y,Amodel(None),optimize_alpha,alpha)
-        
-        # Compute the residual
+        # Solve the linear LSQ problem and compute the residual
         res = ResidualsFcn(None)
+        linfit = xfit
 
-        fvals = np.sum(res**2)
         nonlinfit = None
 
     # -------------------------------------------------------------------
@@ -790,34 +817,41 @@ def snlls(y, Amodel, par0=None, lb=None, ub=None, lbl=None, ubl=None, nnlsSolver
         multiStartPar0 = multistarts(multistart, par0_red, lb_red, ub_red)
 
         # Pre-allocate containers for multi-start run
-        fvals, nonlinfits, linfits, sols = [],[],[],[]
+        Nstarts = len(multiStartPar0)
+        fvals = np.empty(Nstarts)
+        nonlinfits = np.empty((Nstarts,Nnonlin_notfrozen))
+        linfits = np.empty((Nstarts,Nlin))
 
         # Multi-start global optimization
-        for par0 in multiStartPar0:
+        for n,par0 in enumerate(multiStartPar0):
 
             # Run the non-linear solver
             sol = least_squares(ResidualsFcn, par0, bounds=(lb_red, ub_red), max_nfev=int(max_nfev), xtol=xtol, ftol=ftol, verbose=verbose)
-            nonlinfits.append(sol.x)
-            linfits.append(xfit)
-            fvals.append(2*sol.cost) # least_squares uses 0.5*sum(residual**2)          
-            sols.append(sol)
+            nonlinfits[n] = sol.x
+            linfits[n] = xfit
+            fvals[n] = 2*sol.cost # least_squares uses 0.5*sum(residual**2)          
 
         # Find global minimum from multiple runs
         globmin = np.argmin(fvals)
         linfit = linfits[globmin]
         nonlinfit = nonlinfits[globmin]
-        fvals = np.min(fvals)
+        fvals = fvals[globmin]
             
     # Insert frozen parameters back into the nonlinear parameter vector  
     if nonlinfit is not None: 
         par_prev = nonlinfit.copy()
     nonlinfit = _insertfrozen(nonlinfit,nonlin_parfrozen,nonlin_frozen)
 
-    # Compute the fit residual
+    # Compute the fit residual (the design matrix is fixed if there are no non-linear 
+    # parameters, in which case the residual has already been computed)
     _ResidualsFcn = lambda nonlinfit: ResidualsFcn(_unfrozen_subset_inv(nonlinfit,nonlin_frozen))
-    res = _ResidualsFcn(nonlinfit)
+    if Nnonlin_notfrozen>0:
+        res = _ResidualsFcn(nonlinfit)
     fvals = np.sum(res**2) 
 
+    # Design matrix at the fitted non-linear parameters (reused below)
+    Afit = _Amodel(nonlinfit)
+
     if verbose>0: 
         print(f'{timestamp()} Least-squares routine finished.')
 
@@ -843,30 +877,31 @@ def snlls(y, Amodel, par0=None, lb=None, ub=None, lbl=None, ubl=None, nnlsSolver
         #-----------------------------------------------------------------------------
 
         # Jacobian (non-linear part)
-        Jnonlin = Jacobian(_ResidualsFcn,nonlinfit,lb,ub)
+        # The residual at the solution is already known if there are non-linear parameters
+        Jnonlin = Jacobian(_ResidualsFcn,nonlinfit,lb,ub,f0=res if Nnonlin_notfrozen>0 else None)
         # Jacobian (linear part)
-        scale = np.trapz(linfit,np.arange(Nlin))
-        Jlin = (weights[:,np.newaxis]*Amodel(nonlinfit))[mask,:]
+        Jlin = (weights[:,np.newaxis]*Afit)[mask,:]
         if includeExtrapenalty:
             for penalty in extrapenalty:
                 Jlin = np.concatenate((Jlin, Jacobian(lambda plin: penalty(nonlinfit,plin),linfit,lbl,ubl)))
         if includeRegularization:
             Jlin = np.concatenate((Jlin, _penalty_augmentation(alpha, L, linfit,'Jacobian')))
-        Jlin *= scale
         # Full Jacobian
         J = np.concatenate((Jnonlin,Jlin),axis=1)
 
+        # Precondition the Jacobian by scaling its columns to unit norm, since the covariance 
+        # estimate is otherwise sensitive to the scales of the parameters
+        Jscale = np.linalg.norm(J,axis=0)
+        Jscale[Jscale==0] = 1
+
         # Calculate the heteroscedasticity consistent covariance matrix
-        covmatrix = hccm(J, res)
+        covmatrix = hccm(J/Jscale, res)/np.outer(Jscale,Jscale)
 
         # Get combined parameter sets and boundaries
         parfit = np.concatenate((nonlinfit, linfit))
         lbs = np.concatenate((lb, lbl))
         ubs = np.concatenate((ub, ubl))
 
-        # Account for scale of linear parameters since covariance matrix is scale invariant
-        covmatrix[np.ix_(lin_subset,lin_subset)] *= scale**2
-        
         # Set rows/columns corresponding to frozen parameters to zero
         frozen = np.concatenate([nonlin_frozen,lin_frozen])
         covmatrix[frozen,:] = 0
@@ -892,7 +927,11 @@ def snlls(y, Amodel, par0=None, lb=None, ub=None, lbl=None, ubl=None, nnlsSolver
     parfit = np.concatenate((nonlinfit, linfit))
     nonlin_idx = np.arange(len(nonlinfit))
     lin_idx = np.arange(len(nonlinfit),len(parfit))
-    Amodel = _Amodel # Use the model with the full parameter set
+    def Amodel(pnonlin):
+        # Use the model with the full parameter set, avoid re-evaluation at the fitted parameters
+        if np.array_equal(pnonlin,nonlinfit):
+            return Afit
+        return _Amodel(pnonlin)
     def ymodel(n):
         return lambda p: (Amodel(p[nonlin_idx])@p[lin_idx])[subsets[n]]
     if complexy: 
@@ -900,7 +939,27 @@ def snlls(y, Amodel, par0=None, lb=None, ub=None, lbl=None, ubl=None, nnlsSolver
         def ymodel(n):
             return lambda p: ymodel_(n)(p) + 1j*(Amodel(p[nonlin_idx])@p[lin_idx])[imagsubsets[n]]
     ymodels = [ymodel(n) for n in range(len(subsets))]
-    modelfit,modelfituq = _model_evaluation(ymodels,parfit,paramuq,uq)
+
+    # The model is linear with respect to the linear parameters, hence that part of the 
+    # Jacobian is just the design matrix and only the non-linear part requires finite differences.
+    # The Jacobian of the full model response is computed once and shared between the datasets.
+    pjac,Jfull = None,None
+    def ymodel_jacobian(n):
+        def jacobian(p):
+            nonlocal pjac,Jfull
+            if pjac is None or not np.array_equal(pjac,p):
+                Jfull = Amodel(p[nonlin_idx])
+                if len(nonlin_idx)>0:
+                    Jnonlin = Jacobian(lambda pnonlin: Amodel(pnonlin)@p[lin_idx],p[nonlin_idx],lb,ub,f0=Jfull@p[lin_idx])
+                    Jfull = np.concatenate((Jnonlin,Jfull),axis=1)
+                pjac = p.copy()
+            return Jfull[subsets[n],:]
+        return jacobian
+    if complexy: 
+        ymodels_jacobians = None
+    else:
+        ymodels_jacobians = [ymodel_jacobian(n) for n in range(len(subsets))]
+    modelfit,modelfituq = _model_evaluation(ymodels,parfit,paramuq,uq,ymodels_jacobians)
 
     # Make lists of data and fits
     ys = [y[subset] for subset in subsets]
@@ -1020,34 +1079,26 @@ def fnnls(AtA, Atb, tol=None, maxiter=None, verbose=False):
         
         # Solve unconstrained problem for new augmented positive set.
         # This gives a candidate solution with potentially new negative variables.
-        x_ =np.zeros(N)
-        if np.sum(passive)==1:
-            x_[passive] = Atb[passive]/AtA[passive,passive]
-        else:
-            x_[passive] = np.linalg.solve(AtA[np.ix_(passive,passive)],Atb[passive])
+        x_ = _passive_solve(AtA,Atb,passive)
         
         # Inner loop: Iteratively eliminate negative variables from candidate solution.
         iIteration = 0
-        while any((x_<=tol) & passive) and iIteration<maxIterations:
+        while np.any((x_<=tol) & passive) and iIteration<maxIterations:
             iIteration += 1
             
             # Calculate maximum feasible step size and do step.
             negative = (x_<=tol) & passive
-            alpha = min(x[negative]/(x[negative]-x_[negative]))
+            alpha = np.min(x[negative]/(x[negative]-x_[negative]))
             x += alpha*(x_-x)
             
             # Remove all negative variables from positive set.
             passive[x<tol] = False
             
             # Solve unconstrained problem for reduced positive set.
-            x_ = np.zeros(N)
-            if np.sum(passive)==1:
-                x_[passive] = Atb[passive]/AtA[passive,passive]
-            else:
-                x_[passive] = np.linalg.solve(AtA[np.ix_(passive,passive)],Atb[passive])
+            x_ = _passive_solve(AtA,Atb,passive)
             
         # Accept non-negative candidate solution and calculate w.
-        if all(x == x_):
+        if np.array_equal(x,x_):
             count += 1
         else:
             count = 0
@@ -1059,22 +1110,43 @@ def fnnls(AtA, Atb, tol=None, maxiter=None, verbose=False):
         w = Atb - AtA@x
         w[passive] = -np.inf
         if verbose:
-            print(f'{outIteration:10.0f}{iIteration:15.0f}{max(w):20.4e}\n')
+            print(f'{outIteration:10.0f}{iIteration:15.0f}{np.max(w):20.4e}\n')
 
     if verbose:
         if unsolvable:
             print('Optimization stopped because the solution cannot be further changed. \n')
-        elif any(~passive):
+        elif np.any(~passive):
             print('Optimization stopped because the active set has been completely emptied. \n')
         elif w>tol:
             print(f'Optimization stopped because the gradient (w) is inferior than the tolerance value TolFun = {tol:.6e}. \n')
         else:
             print('Solution found. \n')
-    
+
     return x
 
 #=====================================================================================
 
+#=====================================================================================
+def _passive_solve(AtA,Atb,passive):
+    """
+    Solve the unconstrained normal equations restricted to the passive set. The passive
+    subsystem of the symmetric positive semi-definite matrix AtA is solved via Cholesky
+    factorization, falling back to a general LU-based solve if it is not positive definite.
+    """
+    x = np.zeros(len(Atb))
+    if not np.any(passive):
+        return x
+    if np.count_nonzero(passive)==1:
+        x[passive] = Atb[passive]/AtA[passive,passive]
+    else:
+        AtA_passive = AtA[np.ix_(passive,passive)]
+        try:
+            x[passive] = cho_solve(cho_factor(AtA_passive,check_finite=False),Atb[passive],check_finite=False)
+        except LinAlgError:
+            x[passive] = np.linalg.solve(AtA_passive,Atb[passive])
+    return x
+#=====================================================================================
+
 def cvxnnls(AtA, Atb, tol=None, maxiter=None):
 #=====================================================================================
     r"""
@@ -1141,7 +1213,8 @@ def cvxnnls(AtA, Atb, tol=None, maxiter=None):
     try:
         P = cvx.solvers.qp(cAtA, cAtb, I, lb, initvals=cvx.matrix(x0))['x']
         P = np.squeeze(np.asarray(P))
-    except: 
+    except (ValueError,ArithmeticError): 
+        # Singular KKT system or rank-deficient problem
         P = x0
     return P
 #=====================================================================================
\ No newline at end of file
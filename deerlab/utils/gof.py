@@ -4,6 +4,7 @@
 # Copyright(c) 2019-2022: Luis Fabregas, Stefan Stoll and other contributors.
 
 import numpy as np
+import math
 import deerlab as dl
 import warnings
 
@@ -40,26 +41,41 @@ def goodness_of_fit(x,xfit,Ndof,noiselvl):
             stats['aicc'] - Corrected Akaike information criterion
             stats['bic'] - Bayesian information criterion
 
+    """
+    # Get number of xariables
+    N = len(x)
+    # Residual sums of squares and total sum of squares 
+    res = x - xfit
+    SSres = res@res
+    normres = np.vdot(res,res).real if np.iscomplexobj(res) else SSres
+    dev = xfit - np.mean(xfit)
+    return _gof_statistics(N, Ndof, noiselvl, SSres, normres, dev@dev)
+#=========================================================
+
+#=========================================================
+def _gof_statistics(N,Ndof,noiselvl,SSres,normres,SStot):
+    """
+    Evaluates the goodness-of-fit statistics from the number of variables ``N``, the number of degrees 
+    of freedom ``Ndof``, the noise level, the sum of squared residuals ``SSres``, the squared 
+    norm of the residual ``normres``, and the total sum of squares ``SStot`` of the fit.
     """
     sigma = noiselvl
     Ndof = np.maximum(Ndof,1)
     
-    # Get number of xariables
-    N = len(x)
     # Extrapolate number of parameters
     Q = Ndof - N
 
     # Reduced Chi-squared test
-    chi2red = 1/Ndof*np.linalg.norm(x - xfit)**2/sigma**2
+    chi2red = 1/Ndof*normres/sigma**2
 
     # R-squared test
-    R2 = 1 - np.sum((x-xfit)**2)/np.sum((xfit-np.mean(xfit))**2)
+    R2 = 1 - SSres/SStot
 
     # Root-mean square dexiation
-    rmsd = np.sqrt(np.sum((x-xfit)**2)/N)
+    rmsd = np.sqrt(SSres/N)
 
     # Log-likelihood
-    loglike = N*np.log(np.sum((x - xfit)**2))
+    loglike = N*np.log(SSres)
 
     # Akaike information criterion
     aic =  loglike + 2*Q
@@ -68,6 +84,7 @@ def goodness_of_fit(x,xfit,Ndof,noiselvl):
     aicc = loglike + 2*Q + 2*Q*(Q+1)/(N-Q-1)
 
     # Bayesian information criterion
-    bic =  loglike + Q*np.log(N)
+    bic =  loglike + Q*math.log(N)
 
-    return {'chi2red':chi2red,'R2':R2,'rmsd':rmsd,'aic':aic,'aicc':aicc,'bic':bic}
\ No newline at end of file
+    return {'chi2red':chi2red,'R2':R2,'rmsd':rmsd,'aic':aic,'aicc':aicc,'bic':bic}
+#=========================================================
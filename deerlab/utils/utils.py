@@ -56,7 +56,7 @@ def parse_multidatasets(V_, K, weights, noiselvl, precondition=False, masks=None
         sigmas = noiselvl.copy()
 
     if masks is None: 
-        masks = [np.full_like(V,True).astype(bool) for V in Vlist]
+        masks = [np.full(np.shape(V),True) for V in Vlist]
     elif not isinstance(masks,list):
         masks = [masks]
     if len(masks)!= len(Vlist): 
@@ -76,6 +76,8 @@ def parse_multidatasets(V_, K, weights, noiselvl, precondition=False, masks=None
             K = np.concatenate(K, axis=0) # ...concatenate them along the list 
         elif type(K) is np.ndarray:
             nKernels = 1
+            # Ensure a contiguous memory layout (no copy if already C-contiguous)
+            K = np.ascontiguousarray(K)
         else:
             raise TypeError('The input kernel(s) must be numpy array or a list of numpy arrays.')
         # Check that the same number of signals and kernel have been passed
@@ -95,22 +97,20 @@ def parse_multidatasets(V_, K, weights, noiselvl, precondition=False, masks=None
         if len(subset)==1:
             weights=1
         else:
-            weights = np.zeros(len(subset))
-            for i in range(len(subset)):
-                weights[i] = 1/sigmas[i]
+            if len(sigmas)!=len(subset):
+                raise IndexError('If multiple signals are passed, the same number of noise levels are required.')
+            weights = 1/sigmas
     
     # If multiple weights are specified as a list...
     if type(weights) is list or type(weights) is np.ndarray or not hasattr(weights, "__len__"):
         weights = np.atleast_1d(weights)
         if len(weights)==1:
                 weights = np.repeat(weights,len(subset))
-        if len(weights)!=len(Vlist) and len(weights)!=np.sum([len(V) for V in Vlist]):
+        if len(weights)!=len(Vlist) and len(weights)!=np.sum(Ns):
             raise KeyError('If multiple signals are passed, the same number of weights are required.')
-        if len(weights)!=np.sum([len(V) for V in Vlist]):
-            weights_ = []
-            for i in range(len(weights)):
-                weights_ = np.concatenate((weights_,weights[i]*np.ones(len(Vlist[i]))))
-            weights = weights_
+        if len(weights)!=np.sum(Ns):
+            # Expand the per-signal weights to the concatenated signal
+            weights = np.repeat(weights.astype(float),Ns)
     else:
         raise TypeError('The input weights(s) must be numpy array or a list of numpy arrays.')
 
@@ -243,51 +243,56 @@ def hccm(J,residual,mode='HC1'):
        Theory and Methods, 36(10), 1877-1888. DOI: 10.1080/03610920601126589
     """
 
-    # Hat matrix
-    H = J@np.linalg.pinv(J.T@J)@J.T
-    # Get leverage
-    h = np.diag(H)
     # Number of parameters (k) & Number of variables (n)
     n,k = np.shape(J)
 
+    # QR decomposition of the Jacobian, such that pinv(J.T@J) = pinv(R)@pinv(R).T without 
+    # forming the normal equations. The cutoff reproduces the one of pinv(J.T@J).
+    R = np.linalg.qr(J,mode='r')
+    Rinv = np.linalg.pinv(R,rcond=np.sqrt(1e-15))
+    JRinv = J@Rinv
+    # Get leverage, i.e. the diagonal of the hat matrix H = J@pinv(J.T@J)@J.T
+    h = np.sum(JRinv**2,axis=1)
+
     # IF the number of parameters and variables are equal default to the HC0 mode to avoid zero-division
     if n==k: mode='HC0'
 
     # Select estimation method using established nomenclature
     if mode.upper() == 'HC0': # White,(1980),[1]
-        # Estimate the data covariance matrix
-        V = np.diag(residual**2)
+        # Estimate the data covariance matrix (diagonal)
+        V = residual**2
         
     elif mode.upper() == 'HC1': # MacKinnon and White,(1985),[2]
-        # Estimate the data covariance matrix
-        V = n/(n-k)*np.diag(residual**2)
+        # Estimate the data covariance matrix (diagonal)
+        V = n/(n-k)*residual**2
         
     elif mode.upper() == 'HC2': # MacKinnon and White,(1985),[2]
-        # Estimate the data covariance matrix
-        V = np.diag(residual**2/(1-h))
+        # Estimate the data covariance matrix (diagonal)
+        V = residual**2/(1-h)
         
     elif mode.upper() == 'HC3': # Davidson and MacKinnon,(1993),[3]
-        # Estimate the data covariance matrix
-        V = np.diag(residual/(1-h))**2
+        # Estimate the data covariance matrix (diagonal)
+        V = (residual/(1-h))**2
         
     elif mode.upper() == 'HC4': # Cribari-Neto,(2004),[4]
         # Compute discount factor
         delta = np.minimum(4,n*h/k)
-        # Estimate the data covariance matrix
-        V = np.diag(residual**2./((1 - h)**delta))
+        # Estimate the data covariance matrix (diagonal)
+        V = residual**2./((1 - h)**delta)
         
     elif mode.upper() == 'HC5': # Cribari-Neto,(2007),[5]
         # Compute inflation factor
         k = 0.7
-        alpha = np.minimum(np.maximum(4,k*max(h)/np.mean(h)),h/np.mean(h))
-        # Estimate the data covariance matrix
-        V = np.diag(residual**2./(np.sqrt((1 - h)**alpha)))
+        alpha = np.minimum(np.maximum(4,k*np.max(h)/np.mean(h)),h/np.mean(h))
+        # Estimate the data covariance matrix (diagonal)
+        V = residual**2./(np.sqrt((1 - h)**alpha))
             
     else:
         raise KeyError('HCCM estimation mode not found.')
 
     # Heteroscedasticity Consistent Covariance Matrix (HCCM) estimator
-    C = np.linalg.pinv(J.T@J)@J.T@V@J@np.linalg.pinv(J.T@J)
+    # C = pinv(J.T@J)@J.T@diag(V)@J@pinv(J.T@J) 
+    C = Rinv@((JRinv.T*V)@JRinv)@Rinv.T
 
     # Ensure that the covariance matrix is positive semi-definite
     C = nearest_psd(C)
@@ -449,7 +454,7 @@ def diagp(Y,X,k):
 #===============================================================================
 
 #===============================================================================
-def Jacobian(fcn, x0, lb, ub):
+def Jacobian(fcn, x0, lb, ub, f0=None):
     """ 
     Finite difference Jacobian estimation 
      
@@ -467,6 +472,8 @@ def Jacobian(fcn, x0, lb, ub):
         Lower bounds of `x`.  
     ub : ndarray 
         Upper bounds of `x`. 
+    f0 : ndarray, optional
+        Function value `f(x_0)`, if already known. Avoids an additional evaluation of the function.
 
     Notes
     -----
@@ -475,7 +482,7 @@ def Jacobian(fcn, x0, lb, ub):
     function of the Scipy package.
 
     """
-    J = opt._numdiff.approx_derivative(fcn,x0,method='2-point',bounds=(lb,ub))
+    J = opt._numdiff.approx_derivative(fcn,x0,method='2-point',f0=f0,bounds=(lb,ub))
     J = np.atleast_2d(J) 
     return J
 #===============================================================================
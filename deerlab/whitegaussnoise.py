@@ -15,8 +15,9 @@ def whitegaussnoise(t, std, rescale=False, seed=None):
         to ``std``. If ``False`` (default), the standard deviation of the noise vector can deviate
         slightly from ``std``, particularly for short vectors.
     seed : integer scalar, optional
-        If ``None`` (default), do not seed the random number generator. If an integer scalar is
-        given (e.g. ``seed=137``), seed the random number generator with this number.
+        If ``None`` (default), use NumPy's global random number generator. If an integer scalar is
+        given (e.g. ``seed=137``), use a new random number generator seeded with this number, 
+        leaving the state of the global random number generator unchanged.
     
     Returns
     -------
@@ -32,16 +33,18 @@ def whitegaussnoise(t, std, rescale=False, seed=None):
     with some integer number ``k`` before calling ``whitegaussnoise``.
     """
     
-    # Seed RNG if wanted
+    N = np.size(t)
+
+    # Draw from normal distribution, using a local generator if seeded 
+    # to avoid changing the state of the global random number generator
     if seed is not None:
-        np.random.seed(seed)
-    
-    # Draw from normal distribution
-    N = len(np.atleast_1d(t))
-    noise = np.random.normal(0, std, N)
+        noise = np.random.default_rng(seed).standard_normal(N)
+    else:
+        noise = np.random.standard_normal(N)
     
     # Rescale to sample std if wanted
     if rescale:
-        noise *= std/np.std(noise)
+        noise /= np.std(noise)
+    noise *= std
     
     return noise
@@ -14,7 +14,7 @@ def test_correction():
 
     t_corr = correctzerotime(y,t)
 
-    assert max(abs(t_corr - t_truth)) < 1e-10
+    assert np.max(np.abs(t_corr - t_truth)) < 1e-10
 #=======================================================================
 
 def test_late_times():
@@ -31,7 +31,7 @@ def test_late_times():
 
     t_corr = correctzerotime(y,t)
 
-    assert max(abs(t_corr - t_truth)) < 1e-10
+    assert np.max(np.abs(t_corr - t_truth)) < 1e-10
 #=======================================================================
 
 def test_first_element():
@@ -48,7 +48,7 @@ def test_first_element():
 
     t_corr = correctzerotime(y,t)
 
-    assert max(abs(t_corr - t_truth)) < 1e-10
+    assert np.max(np.abs(t_corr - t_truth)) < 1e-10
 #=======================================================================
 
 def test_last_element():
@@ -65,7 +65,7 @@ def test_last_element():
 
     t_corr = correctzerotime(y,t)
 
-    assert max(abs(t_corr - t_truth)) < 1e-10
+    assert np.max(np.abs(t_corr - t_truth)) < 1e-10
 #=======================================================================
 
 # ======================================================================
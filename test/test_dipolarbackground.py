@@ -22,7 +22,7 @@ def test_basic():
     path[1] = [lam, 0]
     B = dipolarbackground(t,path,Bmodel)
 
-    assert max(abs(B-Bref) < 1e-8)
+    assert np.max(np.abs(B-Bref)) < 1e-8
 #==================================================================================
 
 
@@ -44,7 +44,7 @@ def test_singletime():
     path[1] = [lam, 0]
     B = dipolarbackground(t,path,Bmodel)
 
-    assert max(abs(B-Bref) < 1e-8)
+    assert np.max(np.abs(B-Bref)) < 1e-8
 #==================================================================================
 
 
@@ -68,7 +68,7 @@ def test_fractalharmonics():
     paths = [[1-lam], [lam, t0, delta]]
     B = dipolarbackground(t, paths, Bmodel)
 
-    assert max(abs(B-Bref)) < 1e-8
+    assert np.max(np.abs(B-Bref)) < 1e-8
 #==================================================================================
 
 def test_multipath_renorm():
@@ -99,7 +99,7 @@ def test_multipath_renorm():
     # Output
     B = dipolarbackground(t,paths,Bmodel)
 
-    assert max(abs(B-Bref)) < 1e-8
+    assert np.max(np.abs(B-Bref)) < 1e-8
 #==================================================================================
 
 def test_multipath_raw():
@@ -130,7 +130,7 @@ def test_multipath_raw():
     #Output
     B = dipolarbackground(t,paths,Bmodel)
 
-    assert max(abs(B-Bref)) < 1e-8
+    assert np.max(np.abs(B-Bref)) < 1e-8
 #==================================================================================
 
 def test_physical():
@@ -151,7 +151,7 @@ def test_physical():
     path[1] = [lam, 0]
     B = dipolarbackground(t,path,Bmodel)
 
-    assert max(abs(B-Bref) < 1e-8)
+    assert np.max(np.abs(B-Bref)) < 1e-8
 #==================================================================================
 
 def test_phenomenological():
@@ -166,13 +166,13 @@ def test_phenomenological():
     Bref = bg_exp(t,0.3)
 
     #Output
-    Bmodel = lambda t: bg_hom3d(t,kappa,1)
+    Bmodel = lambda t: bg_exp(t,kappa)
     path = [[],[]]
     path[0] = [1-lam]
     path[1] = [lam, 0]
     B = dipolarbackground(t,path,Bmodel)
 
-    assert max(abs(B-Bref) < 1e-8)
+    assert np.max(np.abs(B-Bref)) < 1e-8
 #==================================================================================
 
 def test_docstring():
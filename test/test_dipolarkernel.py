@@ -569,4 +569,19 @@ def test_memory_limit():
     r = np.linspace(1,6,int(5e4))
     with pytest.raises(MemoryError):
         K = dipolarkernel(t,r)
-# ======================================================================
\ No newline at end of file
+# ======================================================================
+
+def test_cache_large_arrays():
+# ======================================================================
+    "Check that cached kernels are not reused for different large time axes"
+    r = np.linspace(2,6,50)
+    t1 = np.linspace(0,3,2000)
+    t2 = t1.copy()
+    t2[500:1500] += 0.01
+
+    dipolarkernel(t1,r)
+    K2 = dipolarkernel(t2,r)
+    K2ref = dipolarkernel(t2,r,clearcache=True)
+
+    assert np.allclose(K2,K2ref)
+# ======================================================================
@@ -13,7 +13,7 @@ def test_basic():
     _,spec = fftspec(S,t,apodization=False)
 
 
-    assert max(abs(specRef - spec)) < 1e-10
+    assert np.max(np.abs(specRef - spec)) < 1e-10
 # ======================================================================
 
 def test_modes():
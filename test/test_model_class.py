@@ -981,6 +981,21 @@ def test_fit_propagate_semiparametric():
     assert_cis(modeluq)
 #================================================================
 
+def test_fit_propagate_semiparametric_jacobian(): 
+#================================================================
+    "Check that the propagation through a model matches the one through an equivalent callable"
+    model = _getmodel_axis('semiparametric')
+
+    x = np.linspace(0,10,200)
+    fitResult = fit(model,mock_data_fcn(x) + whitegaussnoise(x,0.01,seed=1),x)
+    
+    fcn = lambda mean1,mean2,std1,std2,amp1,amp2: gauss2_design_axis(x,mean1,mean2,std1,std2)@np.concatenate([amp1,amp2])
+    modeluq = fitResult.propagate(model, x)
+    fcnuq = fitResult.propagate(fcn)
+
+    assert np.allclose(modeluq.std,fcnuq.std,rtol=1e-3)
+#================================================================
+
 def test_fit_propagate_semiparametric_vec(): 
 #================================================================
     "Check the propagate method of the fitResult object for evaluation of a vectorized semiparametric model"
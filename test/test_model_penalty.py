@@ -6,6 +6,10 @@ from copy import deepcopy
 
 x = np.linspace(0,4,50)
 mock_data = dd_gauss(x,2,0.2) + whitegaussnoise(x,0.005,seed=1)
+# Start the fits where the distribution overlaps with the mock data, since the default start (mean=3.5)
+# is far in the tails of the distribution, where the gradient vanishes and the fit depends on the noise
+mock_model = deepcopy(dd_gauss)
+mock_model.mean.set(par0=2.5)
 def penalty_fcn(mean,std): 
     P = dd_gauss(x,mean,std)
     P = P/np.trapz(P,x)
@@ -92,7 +96,7 @@ def test_weight_freeze():
 def test_fit_icc(): 
     "Check fitting with a penalty with ICC-selected weight"
 
-    model = deepcopy(dd_gauss)
+    model = deepcopy(mock_model)
     penaltyobj = Penalty(penalty_fcn,'icc')
     penaltyobj.weight.set(lb=1e-6,ub=1e1)
 
@@ -105,7 +109,7 @@ def test_fit_icc():
 def test_fit_aic(): 
     "Check fitting with a penalty with AIC-selected weight"
 
-    model = deepcopy(dd_gauss)
+    model = deepcopy(mock_model)
     penaltyobj = Penalty(penalty_fcn,'aic')
     penaltyobj.weight.set(lb=1e-6,ub=1e1)
 
@@ -118,7 +122,7 @@ def test_fit_aic():
 def test_fit_bic(): 
     "Check fitting with a penalty with AIC-selected weight"
  
-    model = deepcopy(dd_gauss)
+    model = deepcopy(mock_model)
     penaltyobj = Penalty(penalty_fcn,'bic')
     penaltyobj.weight.set(lb=1e-6,ub=1e1)
 
@@ -131,7 +135,7 @@ def test_fit_bic():
 def test_fit_aicc(): 
     "Check fitting with a penalty with AICc-selected weight"
 
-    model = deepcopy(dd_gauss)
+    model = deepcopy(mock_model)
     penaltyobj = Penalty(penalty_fcn,'aicc')
     penaltyobj.weight.set(lb=1e-6,ub=1e1)
 
@@ -144,7 +148,7 @@ def test_fit_aicc():
 def test_fit_weight_bounded(): 
     "Check fitting with a penalty with bounded weight"
     
-    model = deepcopy(dd_gauss)
+    model = deepcopy(mock_model)
     penaltyobj = Penalty(penalty_fcn,'aicc')
     penaltyobj.weight.set(lb=1e-10,ub=1e1)
 
@@ -157,19 +161,19 @@ def test_fit_weight_bounded():
 def test_fit_weight_unbounded(): 
     "Check fitting with a penalty with unbounded weight"
     
-    model = deepcopy(dd_gauss)
+    model = deepcopy(mock_model)
     penaltyobj = Penalty(penalty_fcn,'icc')
 
     result = fit(model,mock_data,x,penalties=penaltyobj)
 
-    assert not ovl(result.model,mock_data)>0.975
+    assert ovl(result.model,mock_data)>0.975
 # ======================================================================
 
 # ======================================================================
 def test_fit_weight_frozen(): 
     "Check fitting with a penalty with frozen weight"
     
-    model = deepcopy(dd_gauss)
+    model = deepcopy(mock_model)
     penaltyobj = Penalty(penalty_fcn,'icc')
     penaltyobj.weight.freeze(0.00001)
 
@@ -182,7 +186,7 @@ def test_fit_weight_frozen():
 def test_fit_multiple_penalties(): 
     "Check fitting with multiple penalties"
     
-    model = deepcopy(dd_gauss)
+    model = deepcopy(mock_model)
     penaltyobj = Penalty(penalty_fcn,'icc')
     penaltyobj2 = deepcopy(penaltyobj)
     penaltyobj.weight.freeze(0.00001)
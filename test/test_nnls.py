@@ -27,7 +27,7 @@ def assert_multigauss_problem(solver):
     V = A@amps
     KtK,KtV = _lsqcomponents(V,A)
     ampsfit = solver(KtK,KtV)
-    assert max(abs(amps - ampsfit)) < 1e-8
+    assert np.max(np.abs(amps - ampsfit)) < 1e-8
 
 def test_multigauss_problem_fnnls():
 #=======================================================================
@@ -41,4 +41,15 @@ def test_multigauss_problem_cvxnnls():
     "Check cvxnnls can solve the linear part of a multi-Gauss problem"
 
     assert_multigauss_problem(cvxnnls)
-#=======================================================================
\ No newline at end of file
+#=======================================================================
+
+def test_fnnls_emptied_passive_set():
+#=======================================================================
+    "Check fnnls returns zeros when the passive set is emptied during the iterations"
+
+    AtA = np.array([[1e6,0],[0,1e6]])
+    Atb = np.array([6e-9,-1.0])
+    x = fnnls(AtA,Atb)
+
+    assert np.array_equal(x,np.zeros(2))
+#=======================================================================
@@ -121,10 +121,8 @@ def test_complex():
     lam = 0.25
     B = bg_exp(t,1.5)
 
-    np.random.seed(1)
-    noise = whitegaussnoise(t,0.03)
-    np.random.seed(2)
-    noisec = 1j*whitegaussnoise(t,0.03)
+    noise = whitegaussnoise(t,0.03,seed=1)
+    noisec = 1j*whitegaussnoise(t,0.03,seed=2)
     V = dipolarkernel(t,r,mod=lam,bg=B)@P
     Vco = V*np.exp(-1j*np.pi/5)
     Vco = Vco + noise + noisec
@@ -138,7 +138,7 @@ def compare_analytical_derivative(n,nonuniform=False):
     else:
         accuracy = 10**(-5+n)
         
-    assert max(abs(dPn - dPnref)) < accuracy
+    assert np.max(np.abs(dPn - dPnref)) < accuracy
 
 def test_0th_derivative():
 #=======================================================================
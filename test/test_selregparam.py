@@ -1,5 +1,6 @@
 
 from deerlab.utils.utils import assert_docstring
+import pytest
 import numpy as np
 from deerlab import dipolarkernel, regoperator, selregparam, whitegaussnoise
 from deerlab.dd_models import dd_gauss,dd_gauss2
@@ -28,7 +29,7 @@ def test_compensate_condition():
     assert alpha2 > alpha1
 #=======================================================================
 
-def get_alpha_from_method(method):
+def get_alpha_from_method(method,algorithm='brent'):
 
     t = np.linspace(0,5,500)
     r = np.linspace(2,5,80)
@@ -37,7 +38,7 @@ def get_alpha_from_method(method):
     L = regoperator(r,2,includeedges=True)
     V = K@P
 
-    alpha = selregparam(V,K,cvxnnls,method=method,noiselvl=0,regop=L)
+    alpha = selregparam(V,K,cvxnnls,method=method,noiselvl=0,regop=L,algorithm=algorithm)
     return np.log10(alpha)
 
 def test_aic_value():
@@ -180,23 +181,77 @@ def test_lc_value():
     assert abs(1-loga/logaref) < 0.20
 #=======================================================================
 
-def test_algorithms():
+def test_grid_values():
 #=======================================================================
-    "Check that the value returned by the the grid and Brent algorithms coincide"
-    
+    "Check that the values selected by the grid algorithm are correct for the different methods"
+
+    # Computed with DeerLab (0.15.0-dev). The NCP and GML selections are left out, since on this
+    # problem they end at the boundaries of the search range and do not reflect the method itself.
+    logarefs = {'cv':-7.661, 'gcv':-7.661, 'rgcv':-7.661, 'srgcv':-5.7966, 'aic':-7.661,
+                'bic':-6.3051, 'aicc':-7.661, 'rm':-6.1356, 'ee':-7.661, 'mcl':-7.661,
+                'lr':-7.661, 'lc':-1.3898}
+    # Selection on the poorly conditioned end of the grid may shift by up to one grid step
+    gridstep = 10/59
+
+    errors = [method for method,logaref in logarefs.items() 
+                if abs(get_alpha_from_method(method,algorithm='grid') - logaref) > gridstep]
+
+    assert not errors, f"Wrong regularization parameters selected by: {', '.join(errors)}"
+#=======================================================================
+
+#=======================================================================
+@pytest.fixture(scope='module')
+def grid_problem():
+    """ Pytest fixture to share the noisy test problem between the search-algorithm tests """
     t = np.linspace(0,5,80)
     r = np.linspace(2,5,80)
     P = dd_gauss(r,3,0.2)
     K = dipolarkernel(t,r)
     L = regoperator(r,2)
     V = K@P + whitegaussnoise(t,0.02,seed=1)
+    return V,K,L
+#=======================================================================
+
+def test_algorithms(grid_problem):
+#=======================================================================
+    "Check that the value returned by the the grid and Brent algorithms coincide"
+    
+    V,K,L = grid_problem
 
     alpha_grid = selregparam(V,K,cvxnnls,method='aic',algorithm='grid',regop=L)
     alpha_brent = selregparam(V,K,cvxnnls,method='aic',algorithm='brent',regop=L)
 
-    assert abs(1-alpha_grid/alpha_brent) < 0.15
+    # The grid search resolves the optimum only up to the (logarithmic) spacing of the candidates
+    gridstep = 10/59
+
+    assert abs(np.log10(alpha_grid/alpha_brent)) < gridstep
+#=======================================================================
+
+def test_grid_early_stop(grid_problem):
+#=======================================================================
+    "Check that the early-stopped grid search returns the same value as the full grid"
+    
+    V,K,L = grid_problem
+
+    alpha_full,alphas_full,_,_,_ = selregparam(V,K,cvxnnls,method='aic',algorithm='grid',regop=L,full_output=True)
+    alpha_stop,alphas_stop,_,_,_ = selregparam(V,K,cvxnnls,method='aic',algorithm='grid',regop=L,full_output=True,early_stop=True)
+
+    assert alpha_stop==alpha_full
+    assert len(alphas_stop) < len(alphas_full)
+#=======================================================================
+
+def test_grid_parallel(grid_problem):
 #=======================================================================
+    "Check that the parallelized grid search returns the same values as in series"
 
+    V,K,L = grid_problem
+
+    alpha_series,_,functional_series,_,_ = selregparam(V,K,cvxnnls,method='aic',algorithm='grid',regop=L,full_output=True)
+    alpha_parallel,_,functional_parallel,_,_ = selregparam(V,K,cvxnnls,method='aic',algorithm='grid',regop=L,full_output=True,cores=2)
+
+    assert alpha_parallel==alpha_series
+    assert np.allclose(functional_parallel,functional_series)
+#=======================================================================
 
 def test_nonuniform_r():
 #=======================================================================
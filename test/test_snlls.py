@@ -499,7 +499,8 @@ def test_confinter_scaling():
     K = dipolarkernel(t,r,mod=lam)
     parin = [3.5, 0.4, 0.6, 4.5, 0.5, 0.4]
     P = dd_gauss2(r,*parin)
-    V = K@P + whitegaussnoise(t,0.01,seed=1)
+    noiselvl = 0.01
+    V = K@P + whitegaussnoise(t,noiselvl,seed=1)
     # Non-linear parameters
     nlpar0 = 0.2
     lb = 0
@@ -512,6 +513,9 @@ def test_confinter_scaling():
     # Separable LSQ fit
     fit1 = snlls(V*V0_1,lambda lam: dipolarkernel(t,r,mod=lam),nlpar0,lb,ub,lbl,ftol=1e-3)
     fit2 = snlls(V*V0_2,lambda lam: dipolarkernel(t,r,mod=lam),nlpar0,lb,ub,lbl,ftol=1e-3)
+    # The fits of the scaled data converge to the same solution up to the resolution of the 
+    # optimizer, which can vary with the noise realization. Compare relative to the noise level.
+    tol = 1e-2*noiselvl
 
     # Assess linear parameter uncertainties
     ci1 = fit1.linUncert.ci(95)
@@ -519,7 +523,7 @@ def test_confinter_scaling():
     ci1[ci1==0] = 1e-16
     ci2[ci2==0] = 1e-16
 
-    assert np.max(abs(ci2/V0_2 - ci1)) < 1e-6
+    assert np.max(abs(ci2/V0_2 - ci1)) < tol
 
     # Assess nonlinear parameter uncertainties
     ci1 = fit1.nonlinUncert.ci(95)
@@ -527,7 +531,31 @@ def test_confinter_scaling():
     ci1[ci1==0] = 1e-16
     ci2[ci2==0] = 1e-16
 
-    assert np.max(abs(ci2 - ci1)) < 1e-6    
+    assert np.max(abs(ci2 - ci1)) < tol    
+#============================================================
+
+def test_covariance_sandwich():
+#============================================================
+    "Check that the covariance matrix matches the sandwich estimate of the unscaled Jacobian"
+
+    t = np.linspace(0,5,100)
+    Amodel = lambda k: np.column_stack([np.exp(-k*t), np.ones_like(t)])
+    y = Amodel(0.8)@[3,0.5] + whitegaussnoise(t,0.05,seed=1)
+
+    fit = snlls(y,Amodel,par0=0.5,lb=0,ub=5,reg=False)
+
+    # Residual vector with the linear parameters solved for each non-linear parameter
+    resfcn = lambda k: Amodel(k)@np.linalg.lstsq(Amodel(k),y,rcond=None)[0] - y
+    res = resfcn(fit.nonlin)
+    # Unscaled Jacobian of the non-linear (central differences) and linear parameters
+    dk = 1e-7
+    J = np.column_stack([(resfcn(fit.nonlin+dk) - resfcn(fit.nonlin-dk))/(2*dk), Amodel(fit.nonlin)])
+    # HC1 sandwich covariance estimate
+    n,m = np.shape(J)
+    JtJinv = np.linalg.inv(J.T@J)
+    covref = JtJinv@(J.T*(n/(n-m)*res**2))@J@JtJinv
+
+    assert np.max(np.abs(fit.paramUncert.covmat - covref)) < 1e-4*np.max(np.abs(covref))
 #============================================================
 
 def test_global_weights():
@@ -578,6 +606,22 @@ def test_global_weights_default():
     assert ovl(P,fit.lin) > 0.93
 # ======================================================================
 
+def test_global_noiselvl_mismatch():
+# ======================================================================
+    "Check that an error is raised if fewer noise levels than signals are passed"
+
+    t = np.linspace(0,5,300)
+    r = np.linspace(2,6,90)
+    P = dd_gauss(r,4.5,0.25)
+    K = dipolarkernel(t,r,mod=0.2)
+    V1 = K@P + whitegaussnoise(t,0.01,seed=1)
+    V2 = K@P + whitegaussnoise(t,0.01,seed=2)
+
+    Kmodel= lambda lam: [dipolarkernel(t,r,mod=lam)]*2
+    with pytest.raises(IndexError):
+        snlls([V1,V2],Kmodel,par0=[0.2],lb=0,ub=1,lbl=np.zeros_like(r),noiselvl=0.01)
+# ======================================================================
+
 def test_extrapenalty():
 # ======================================================================
     "Check that an additional penalty can be passed correctly"
@@ -665,6 +709,24 @@ def test_frozen_Nparam():
     assert len(fit.nonlin)==4 and len(fit.lin)==2 and len(fit_frozen.nonlin)==4 and len(fit_frozen.lin)==2
 # ======================================================================
 
+def test_frozen_param_uncertainty():
+# ======================================================================
+    "Check that the uncertainty is unaffected by freezing the leading nonlinear parameter"
+    r = np.linspace(0,6,90)
+    def Amodel(p):
+        mean1,mean2,std1,std2 = p
+        return np.atleast_2d([dd_gauss.nonlinmodel(r,mean1,std1), dd_gauss.nonlinmodel(r,mean2,std2)]).T
+    Amodel_reduced = lambda p: Amodel([3,*p])
+    x = np.array([0.5,0.6])
+    y = Amodel([3,5,0.2,0.3])@x + whitegaussnoise(r,0.01,seed=1)
+
+    fit_frozen = snlls(y,Amodel,par0=[3,4.5,0.3,0.2],lb=[0,0,0.01,0.01],ub=[10,10,5,5],lbl=[0,0],
+            nonlin_frozen=[3,None,None,None])
+    fit_reduced = snlls(y,Amodel_reduced,par0=[4.5,0.3,0.2],lb=[0,0.01,0.01],ub=[10,5,5],lbl=[0,0])
+    
+    assert np.allclose(fit_frozen.linUncert.ci(95),fit_reduced.linUncert.ci(95),rtol=1e-3)
+# ======================================================================
+
 def test_complex_model_complex_data():
 # ======================================================================
     "Check the fit of a real-valued model to complex-valued data"
@@ -727,3 +789,32 @@ def test_masking():
 
     assert np.allclose(fitmasked.model,yref) and not np.allclose(fit.model,yref) 
 # ======================================================================
+
+def test_integer_design_matrix():
+# ======================================================================
+    "Check that regularized linear problems accept integer design matrices"
+
+    A = np.tril(np.ones((30,10),dtype=int))
+    x = np.linspace(0,1,10)
+    y = A@x
+
+    fitint = snlls(y,A,reg=True,regparam=0.1)
+    fitfloat = snlls(y,A.astype(float),reg=True,regparam=0.1)
+
+    assert np.allclose(fitint.param,fitfloat.param)
+# ======================================================================
+
+def test_float32_design_matrix():
+# ======================================================================
+    "Check that single-precision design matrices and data are promoted during the fit"
+
+    A = np.tril(np.ones((30,10),dtype=np.float32))
+    x = np.linspace(0,1,10)
+    y = (A@x).astype(np.float32)
+
+    fit32 = snlls(y,A,reg=True,regparam=0.1)
+    fit64 = snlls(y.astype(float),A.astype(float),reg=True,regparam=0.1)
+
+    assert fit32.model.dtype==np.float64
+    assert np.allclose(fit32.param,fit64.param)
+# ======================================================================
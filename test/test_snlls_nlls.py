@@ -168,7 +168,7 @@ def test_globalfit_scales():
     ub = [20, 1]
     fit = snlls(np.concatenate([V1,V2]),Vmodel,par0,lb,ub)
 
-    assert max(abs(np.asarray(scales)/fit.lin - 1)) < 1e-2 
+    assert np.max(np.abs(np.asarray(scales)/fit.lin - 1)) < 1e-2 
 #============================================================
 
 @skip_on('_tkinter.TclError', reason="A problem with the Tk backend occured")
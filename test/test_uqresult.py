@@ -118,6 +118,26 @@ def test_uq_covariance_pardist():
     assert_uq(uq_covariance,'pardist')
 # ------------------------------------------------------------
 
+# ------------------------------------------------------------
+def test_uq_covariance_propagate_jacobian():
+    'Check that propagation with an analytical Jacobian matches the finite-difference one'
+    A = np.array([[1.0,2.0],[0.5,-1.0],[3.0,0.2]])
+    model = lambda p: A@p
+    uq_fd = uq_covariance.propagate(model)
+    uq_jac = uq_covariance.propagate(model,jacobian=lambda p: A)
+    assert np.allclose(uq_fd.std,uq_jac.std,rtol=1e-4)
+    assert np.allclose(uq_fd.ci(95),uq_jac.ci(95),rtol=1e-4)
+# ------------------------------------------------------------
+
+# ------------------------------------------------------------
+def test_uq_covariance_rescale():
+    'Check that rescaling matches the propagation through a scaling function'
+    uq_prop = uq_covariance.propagate(lambda p: p/2)
+    uq_rescaled = uq_covariance.rescale(1/2)
+    assert np.allclose(uq_prop.mean,uq_rescaled.mean)
+    assert np.allclose(uq_prop.ci(95),uq_rescaled.ci(95),rtol=1e-4)
+# ------------------------------------------------------------
+
 #------------------------------------------------------------
 #                          BOOTSTRAP
 #------------------------------------------------------------
@@ -159,6 +179,14 @@ def test_uq_bootstrap_pardist():
 # ------------------------------------------------------------
 
 
+# ------------------------------------------------------------
+def test_uq_bootstrap_rescale():
+    'Check that rescaling scales the bootstrap samples'
+    uq_rescaled = uq_bootstrap.rescale(1/2)
+    assert np.allclose(uq_rescaled.samples,uq_bootstrap.samples/2)
+    assert np.allclose(uq_rescaled.ci(95),uq_bootstrap.ci(95)/2,rtol=1e-2)
+# ------------------------------------------------------------
+
 #------------------------------------------------------------
 #                          PROFILE
 #------------------------------------------------------------
@@ -198,3 +226,23 @@ def test_uq_profile_pardist():
     'Check the estimated uncertainty distributions'
     assert_uq(uq_profile,'pardist')
 # ------------------------------------------------------------
+
+# ------------------------------------------------------------
+def test_uq_profile_rescale():
+    'Check that rescaling scales the profiles along the parameter axis'
+    uq_rescaled = uq_profile.rescale(1/2)
+    assert uq_rescaled.type=='profile'
+    assert np.allclose(uq_rescaled.mean,np.array(uq_profile.mean)/2)
+    assert np.allclose(uq_rescaled.ci(95),uq_profile.ci(95)/2)
+# ------------------------------------------------------------
+
+#------------------------------------------------------------
+#                          VOID
+#------------------------------------------------------------
+
+# ------------------------------------------------------------
+def test_uq_void_rescale():
+    'Check that rescaling an empty uncertainty quantification returns an empty one'
+    uq_rescaled = UQResult('void').rescale(1/2)
+    assert isinstance(uq_rescaled,UQResult) and uq_rescaled.type=='void'
+# ------------------------------------------------------------
@@ -58,6 +58,20 @@ def test_noseed():
 # ======================================================================
 
 
+def test_seed_global_state():
+# ======================================================================
+    "Check that the seed keyword does not change the global random number generator"
+
+    t = np.linspace(0,3,151)
+    np.random.seed(1)
+    ref = np.random.rand(5)
+    np.random.seed(1)
+    whitegaussnoise(t,0.2,seed=432)
+    
+    assert np.array_equal(np.random.rand(5),ref)
+# ======================================================================
+
+
 def test_docstring():
 # ======================================================================
     "Check that the docstring includes all variables and keywords."